@@ -6,25 +6,65 @@ and generating RDF knowledge graphs.
 Uses:
 - spaCy for Named Entity Recognition
 - OpenRouter API (Gemini) for LLM-based claim extraction and persuasion detection
+  (async, concurrent requests per batch)
 - RDFLib for semantic graph generation
-- SPARQLWrapper for Wikidata entity linking
+- Wikidata SPARQL endpoint (pooled HTTP session) for entity linking
 """
 
+import argparse
+import asyncio
+import hashlib
 import json
+import multiprocessing
 import os
+import re
+import string
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
+from contextlib import nullcontext
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import quote
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
-from rdflib import Graph, Namespace, Literal, URIRef, RDF, RDFS, XSD
+from rdflib import Graph, Namespace, Literal, URIRef, BNode, RDF, RDFS, XSD
 from rdflib.namespace import FOAF
 from textblob import TextBlob
-from SPARQLWrapper import SPARQLWrapper, JSON
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests
 import spacy
 import logging
 
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # Optional: enables HTTP/2 for LLM API traffic
+except ImportError:
+    h2 = None
+
+try:
+    import pyoxigraph  # Optional: Rust triple store for fast Turtle serialization
+except ImportError:
+    pyoxigraph = None
+
+try:
+    import uvloop  # Optional: faster event loop for the async LLM stages
+except ImportError:
+    uvloop = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +77,30 @@ def log_success(msg):
     logger.info(f"✓ {msg}")
 
 
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize obj as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_dump_file(obj, path):
+    """Write obj as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2)
+
+
 # Load environment variables
 load_dotenv()
 
@@ -55,9 +119,21 @@ class Config:
     OUTPUT_DIR = "data/output"
     ONTOLOGY_FILE = "persuasion_ontology.ttl"
     LLM_MODEL = MODEL_NAME
+    PROMPT_VERSION = 1  # Bump when prompt templates change to invalidate cached claims/techniques
     CONFIDENCE_THRESHOLD = 0.6
-    BATCH_SIZE = 5
+    BATCH_SIZE = 64  # Posts whose LLM requests are issued concurrently
     MAX_POSTS = 100  # Limit for demo run
+    MAX_CONCURRENCY = 8  # In-flight LLM requests
+    LLM_ROWS_PER_CALL = 8  # Posts/claims marshaled into a single LLM prompt
+    NLP_BATCH_SIZE = 64  # Claims per spaCy nlp.pipe mini-batch
+    NLP_PROCESSES = 1  # spaCy worker processes (>1 for multi-core NER on large runs)
+    CPU_WORKERS = 1  # Processes for per-post sentiment scoring (1 = scored in a thread of this process)
+    REQUESTS_PER_MINUTE = 120  # Provider rate limit
+    MAX_RETRIES = 3  # Retries on 429/5xx (exponential backoff in the OpenAI SDK)
+    CACHE_DIR = "data/cache"  # On-disk cache of LLM and Wikidata responses
+    USE_CACHE = True
+    PERSUASION_PREFILTER = True  # Skip the LLM for posts without loaded-language cues
+    BATCH_POLL_INTERVAL = 60  # Seconds between Batch API status checks (--batch-mode)
 
 
 # ========================================
@@ -124,14 +200,26 @@ class VerificationResult:
 # ========================================
 
 def get_llm_client():
-    """Initialize OpenRouter client for LLM access."""
+    """Initialize async OpenRouter client for LLM access."""
     try:
-        from openai import OpenAI
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
         api_key = os.getenv("OPENROUTER_API_KEY")
         if api_key:
-            client = OpenAI(
+            # Keep one warm connection per in-flight request (multiplexed over
+            # a single connection when HTTP/2 is available)
+            http_client = DefaultAsyncHttpxClient(
+                http2=h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=2 * Config.MAX_CONCURRENCY,
+                    max_keepalive_connections=Config.MAX_CONCURRENCY
+                )
+            )
+            client = AsyncOpenAI(
                 base_url=OPENROUTER_BASE_URL,
-                api_key=api_key
+                api_key=api_key,
+                max_retries=Config.MAX_RETRIES,
+                http_client=http_client
             )
             logger.info(f"OpenRouter client initialized with model: {MODEL_NAME}")
             return client
@@ -143,14 +231,174 @@ def get_llm_client():
         return None
 
 
+class AsyncRateLimiter:
+    """
+    Bound the number of in-flight LLM requests and space request starts
+    so that no more than `requests_per_minute` are issued.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._interval = 60.0 / requests_per_minute
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+            if start > now:
+                await asyncio.sleep(start - now)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
+
+# ========================================
+# Response Cache
+# ========================================
+
+class ResponseCache:
+    """
+    Disk-backed key/value cache (SQLite) for LLM and Wikidata responses.
+    Entries may carry a TTL; expired entries read as misses.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+        if "expires_at" not in columns:  # caches written before TTL support
+            self._conn.execute("ALTER TABLE cache ADD COLUMN expires_at REAL")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """SHA-256 of the JSON-encoded key parts."""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """Store a value, expiring after ttl seconds (never if None)."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+
+
+_caches: Dict[str, ResponseCache] = {}
+
+
+def get_cache(name: str) -> Optional[ResponseCache]:
+    """Return the named response cache, or None when caching is disabled."""
+    if not Config.USE_CACHE:
+        return None
+    if name not in _caches:
+        _caches[name] = ResponseCache(Path(Config.CACHE_DIR) / f"{name}.sqlite")
+    return _caches[name]
+
+
+def _text_digest(text: str) -> str:
+    """Short BLAKE2b digest of a text, used in per-post cache keys."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_cached_records(name: str, *key_parts) -> Optional[List[Dict]]:
+    """Parsed LLM records cached for (model, prompt version, *key_parts), if any."""
+    cache = get_cache(name)
+    if cache is None:
+        return None
+    content = cache.get(ResponseCache.make_key(Config.LLM_MODEL, Config.PROMPT_VERSION, *key_parts))
+    return json_loads(content) if content is not None else None
+
+
+def _cache_records(name: str, records: List[Dict], *key_parts):
+    cache = get_cache(name)
+    if cache is not None:
+        key = ResponseCache.make_key(Config.LLM_MODEL, Config.PROMPT_VERSION, *key_parts)
+        cache.set(key, json_dumps(records))
+
+
+class BatchRequestDeferred(Exception):
+    """Raised instead of calling the LLM while requests are collected for the Batch API."""
+
+
+# When set, _chat_json records uncached requests here (cache key -> request body)
+_batch_requests: ContextVar[Optional[Dict[str, Dict]]] = ContextVar("batch_requests", default=None)
+
+
+def _chat_request(system_prompt: str, prompt: str, temperature: float, response_format: Dict) -> Dict:
+    """Body of a structured-output chat completion request."""
+    return {
+        "model": Config.LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": temperature,
+        "response_format": response_format
+    }
+
+
+async def _chat_json(client, limiter: Optional[AsyncRateLimiter], system_prompt: str,
+                     prompt: str, temperature: float, response_format: Dict) -> Dict:
+    """
+    Run a chat completion constrained to `response_format` and parse its response.
+    Responses that parse are cached on disk keyed by (model, system prompt,
+    prompt, temperature).
+    """
+    cache = get_cache("llm")
+    key = ResponseCache.make_key(Config.LLM_MODEL, system_prompt, prompt, temperature)
+    content = cache.get(key) if cache is not None else None
+    if content is not None:
+        return json_loads(content)
+    
+    pending = _batch_requests.get()
+    if pending is not None:
+        pending[key] = _chat_request(system_prompt, prompt, temperature, response_format)
+        raise BatchRequestDeferred(key)
+    
+    async with limiter or nullcontext():
+        response = await client.chat.completions.create(
+            **_chat_request(system_prompt, prompt, temperature, response_format)
+        )
+    
+    content = response.choices[0].message.content
+    result = json_loads(content)
+    if cache is not None:
+        cache.set(key, content)
+    return result
+
+
 # ========================================
 # NER Setup
 # ========================================
 
+# Pipes of en_core_web_sm the pipeline never reads (only doc.ents is used)
+SPACY_DISABLED_PIPES = ["parser", "tagger", "attribute_ruler", "lemmatizer"]
+
+
 def get_nlp():
-    """Load spaCy NLP model."""
+    """Load spaCy NLP model with only the components needed for NER."""
     try:
-        nlp = spacy.load("en_core_web_sm")
+        nlp = spacy.load("en_core_web_sm", disable=SPACY_DISABLED_PIPES)
         logger.info("spaCy model loaded successfully")
         return nlp
     except OSError:
@@ -174,93 +422,334 @@ PERSUASION_TAXONOMY = {
     "HastyGeneralization": "Drawing broad conclusions from limited examples",
 }
 
+TAXONOMY_BLOCK = "\n".join(f"- {k}: {v}" for k, v in PERSUASION_TAXONOMY.items())
+
+# Lexical cues of persuasive language (emotion/fear words, absolutes, blame,
+# intensifiers, ridicule). Posts matching none of them skip LLM persuasion detection.
+LOADED_RE = re.compile(
+    r"\b(?:"
+    r"corrupt\w*|evil|disaster\w*|threat\w*|catastroph\w*|danger\w*|destroy\w*|"
+    r"crisis|chaos|terrif\w*|horrif\w*|scar(?:y|ed|e)|fear\w*|panic\w*|deadly|kill\w*|"
+    r"attack\w*|war|invasion|enem(?:y|ies)|traitor\w*|crook\w*|liar\w*|lie|lies|lying|"
+    r"fake|hoax|scam\w*|fraud\w*|rigged|propaganda|shame\w*|disgrac\w*|pathetic|"
+    r"stupid|idiot\w*|moron\w*|ridiculous|absurd|joke|clown\w*|radical\w*|extremi\w*|"
+    r"must|never|always|everyone|everybody|nobody|all|every|only|"
+    r"worst|best|greatest|totally|completely|absolutely|literally|huge|massive|"
+    r"blame\w*|fault|expert\w*|scientists?|doctors?|studies|study|proven|"
+    r"wake up|sheep|agenda|elites?|they want|open your eyes"
+    r")\b|!",
+    re.IGNORECASE
+)
+
+
+def passes_persuasion_prefilter(post: Post) -> bool:
+    """True if the post should be sent to the LLM for persuasion detection."""
+    return (
+        not Config.PERSUASION_PREFILTER
+        or bool(post.known_techniques)
+        or LOADED_RE.search(post.text) is not None
+    )
+
 
 # ========================================
-# Stage 1: Claim Extraction
+# Prompt Templates
 # ========================================
+# Built once at import. Static instructions come first and per-call text last,
+# so repeated requests share a byte-identical prefix for provider-side prompt caching.
+# The single and batched prompt of a stage start with the same block, so the
+# prefix is also shared between per-row fallbacks and batched calls.
 
-def extract_claims(post: Post, client) -> List[Claim]:
-    """
-    Extract factual claims from a social media post using LLM.
-    """
-    logger.info(f"Extracting claims from post: {post.post_id}")
-    
-    if client is None:
-        logger.warning("LLM client not available, skipping claim extraction")
-        # Return the full text as a single claim if no LLM
-        return [Claim(
-            id=f"{post.post_id}_claim_1",
-            text=post.text[:500],  # Truncate if too long
-            source_post=post.post_id
-        )]
-    
-    prompt = f"""Analyze the following social media post and extract all factual claims that can be verified.
+CLAIMS_SYSTEM_PROMPT = "You are an expert fact-checker. Always respond with valid JSON only."
+PERSUASION_SYSTEM_PROMPT = "You are an expert in rhetoric and propaganda analysis. Always respond with valid JSON only."
+
+CLAIMS_PROMPT_PREFIX = """Extract all factual claims that can be verified from social media posts.
 For each claim, provide:
 1. The exact text of the claim
 2. A brief description
 
-Post: {post.text}
+"""
+
+PERSUASION_PROMPT_PREFIX = f"""Available persuasion techniques:
+{TAXONOMY_BLOCK}
+
+"""
+
+CLAIMS_TEMPLATE = string.Template(CLAIMS_PROMPT_PREFIX + """Analyze the following post.
 
 Return ONLY valid JSON in this exact format (no markdown, no extra text):
-{{
+{
   "claims": [
-    {{
+    {
       "claim_id": "1",
       "text": "extracted claim",
       "description": "brief description"
-    }}
+    }
+  ]
+}
+
+Post: $post_text""")
+
+CLAIMS_BATCH_TEMPLATE = string.Template(CLAIMS_PROMPT_PREFIX + """Analyze each of the following posts.
+
+Return ONLY valid JSON in this exact format (no markdown, no extra text), with one entry per post:
+{
+  "results": [
+    {
+      "post_idx": 0,
+      "claims": [
+        {
+          "claim_id": "1",
+          "text": "extracted claim",
+          "description": "brief description"
+        }
+      ]
+    }
+  ]
+}
+
+$posts_block""")
+
+PERSUASION_TEMPLATE = string.Template(PERSUASION_PROMPT_PREFIX + """Analyze this claim for the persuasion techniques above.
+
+Return ONLY valid JSON:
+{
+  "techniques": [
+    {
+      "type": "TechniqueName",
+      "confidence": 0.85,
+      "explanation": "Why this technique applies"
+    }
+  ]
+}
+
+Claim: $claim_text
+Full Post Context: $post_text""")
+
+PERSUASION_BATCH_TEMPLATE = string.Template(PERSUASION_PROMPT_PREFIX + """Analyze each of the following claims for the persuasion techniques above.
+Claims are listed under the post they were extracted from; use the post as context.
+
+Return ONLY valid JSON, with one entry per claim:
+{
+  "results": [
+    {
+      "claim_idx": 0,
+      "techniques": [
+        {
+          "type": "TechniqueName",
+          "confidence": 0.85,
+          "explanation": "Why this technique applies"
+        }
+      ]
+    }
   ]
-}}"""
+}
+
+$claims_block""")
+
+# Structured-output schemas mirroring the JSON formats above. In strict mode the
+# provider constrains decoding to the schema, so responses always parse.
+
+def _strict_object(**properties) -> Dict:
+    """JSON Schema object requiring all of its properties and allowing no others."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+def _json_schema_format(name: str, schema: Dict) -> Dict:
+    """response_format value for a strict JSON Schema."""
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+
+_CLAIMS_LIST_SCHEMA = {
+    "type": "array",
+    "items": _strict_object(
+        claim_id={"type": "string"},
+        text={"type": "string"},
+        description={"type": "string"}
+    )
+}
+_TECHNIQUES_LIST_SCHEMA = {
+    "type": "array",
+    "items": _strict_object(
+        type={"type": "string", "enum": list(PERSUASION_TAXONOMY)},
+        confidence={"type": "number"},
+        explanation={"type": "string"}
+    )
+}
+
+CLAIMS_RESPONSE_FORMAT = _json_schema_format(
+    "claims", _strict_object(claims=_CLAIMS_LIST_SCHEMA)
+)
+CLAIMS_BATCH_RESPONSE_FORMAT = _json_schema_format(
+    "claims_batch",
+    _strict_object(results={
+        "type": "array",
+        "items": _strict_object(post_idx={"type": "integer"}, claims=_CLAIMS_LIST_SCHEMA)
+    })
+)
+PERSUASION_RESPONSE_FORMAT = _json_schema_format(
+    "persuasion", _strict_object(techniques=_TECHNIQUES_LIST_SCHEMA)
+)
+PERSUASION_BATCH_RESPONSE_FORMAT = _json_schema_format(
+    "persuasion_batch",
+    _strict_object(results={
+        "type": "array",
+        "items": _strict_object(claim_idx={"type": "integer"}, techniques=_TECHNIQUES_LIST_SCHEMA)
+    })
+)
+
+
+# ========================================
+# Stage 1: Claim Extraction
+# ========================================
+
+def _fallback_claim(post: Post) -> Claim:
+    """Use the full post text (truncated) as a single claim."""
+    return Claim(
+        id=f"{post.post_id}_claim_1",
+        text=post.text[:500],  # Truncate if too long
+        source_post=post.post_id
+    )
+
+
+def _build_claims(post: Post, claims_data: List[Dict]) -> List[Claim]:
+    """Convert parsed LLM claim records into Claim objects for a post."""
+    claims_list = [
+        Claim(
+            id=f"{post.post_id}_{claim_data['claim_id']}",
+            text=claim_data["text"],
+            source_post=post.post_id
+        )
+        for claim_data in claims_data
+    ]
+    return claims_list if claims_list else [_fallback_claim(post)]
+
+
+async def extract_claims(post: Post, client, limiter: AsyncRateLimiter = None) -> List[Claim]:
+    """
+    Extract factual claims from a social media post using LLM.
+    """
+    logger.info(f"Extracting claims from post: {post.post_id}")
+    
+    if client is None:
+        logger.warning("LLM client not available, skipping claim extraction")
+        # Return the full text as a single claim if no LLM
+        return [_fallback_claim(post)]
+    
+    cached = _get_cached_records("claims", _text_digest(post.text))
+    if cached is not None:
+        return _build_claims(post, cached)
+    
+    prompt = CLAIMS_TEMPLATE.substitute(post_text=post.text)
     
     try:
-        response = client.chat.completions.create(
-            model=Config.LLM_MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert fact-checker. Always respond with valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2
+        claims_data = await _chat_json(
+            client, limiter, CLAIMS_SYSTEM_PROMPT, prompt, temperature=0.2,
+            response_format=CLAIMS_RESPONSE_FORMAT
         )
+        records = claims_data.get("claims", [])
+        _cache_records("claims", records, _text_digest(post.text))
+        return _build_claims(post, records)
         
-        content = response.choices[0].message.content.strip()
-        # Remove markdown code blocks if present
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
-        
-        claims_data = json.loads(content)
-        claims_list = []
-        
-        for claim_data in claims_data.get("claims", []):
-            claim = Claim(
-                id=f"{post.post_id}_{claim_data['claim_id']}",
-                text=claim_data["text"],
-                source_post=post.post_id
-            )
-            claims_list.append(claim)
-        
-        return claims_list if claims_list else [Claim(
-            id=f"{post.post_id}_claim_1",
-            text=post.text[:500],
-            source_post=post.post_id
-        )]
-        
+    except BatchRequestDeferred:
+        raise
     except Exception as e:
         logger.error(f"Error extracting claims: {e}")
-        return [Claim(
-            id=f"{post.post_id}_claim_1",
-            text=post.text[:500],
-            source_post=post.post_id
-        )]
+        return [_fallback_claim(post)]
+
+
+async def extract_claims_batch(
+    posts: List[Post], client, limiter: AsyncRateLimiter = None
+) -> List[List[Claim]]:
+    """
+    Extract claims from several posts with a single LLM call (row marshaling).
+    Returns one claim list per post. Posts whose claims are cached from an
+    earlier run are left out of the prompt. Posts missing from the response, or
+    all posts if the response cannot be parsed, are retried with extract_claims.
+    """
+    if client is None or len(posts) == 1:
+        return [await extract_claims(post, client, limiter) for post in posts]
+    
+    claims_per_post: Dict[int, List[Claim]] = {}
+    for idx, post in enumerate(posts):
+        cached = _get_cached_records("claims", _text_digest(post.text))
+        if cached is not None:
+            claims_per_post[idx] = _build_claims(post, cached)
+    pending = [idx for idx in range(len(posts)) if idx not in claims_per_post]
+    if len(pending) <= 1:
+        for idx in pending:
+            claims_per_post[idx] = await extract_claims(posts[idx], client, limiter)
+        return [claims_per_post[idx] for idx in range(len(posts))]
+    
+    logger.info(f"Extracting claims from {len(pending)} posts: {posts[pending[0]].post_id} .. {posts[pending[-1]].post_id}")
+    
+    posts_block = "\n\n".join(f"Post {row}: {posts[idx].text}" for row, idx in enumerate(pending))
+    prompt = CLAIMS_BATCH_TEMPLATE.substitute(posts_block=posts_block)
+    
+    try:
+        result = await _chat_json(
+            client, limiter, CLAIMS_SYSTEM_PROMPT, prompt, temperature=0.2,
+            response_format=CLAIMS_BATCH_RESPONSE_FORMAT
+        )
+        claims_by_post = {}
+        for r in result["results"]:
+            row = int(r["post_idx"])
+            if 0 <= row < len(pending):
+                claims_by_post[pending[row]] = r.get("claims", [])
+    except BatchRequestDeferred:
+        raise
+    except Exception as e:
+        logger.warning(f"Batched claim extraction failed ({e}), retrying per post")
+        claims_by_post = {}
+    
+    missing = [idx for idx in pending if idx not in claims_by_post]
+    retried = await asyncio.gather(*(extract_claims(posts[idx], client, limiter) for idx in missing))
+    claims_per_post.update(zip(missing, retried))
+    for idx, claims_data in claims_by_post.items():
+        _cache_records("claims", claims_data, _text_digest(posts[idx].text))
+        claims_per_post[idx] = _build_claims(posts[idx], claims_data)
+    
+    return [claims_per_post[idx] for idx in range(len(posts))]
 
 
 # ========================================
 # Stage 2: Persuasion Detection
 # ========================================
 
-def detect_persuasion(claim: Claim, post: Post, client) -> List[PersuasionAnnotation]:
+def _known_annotations(claim: Claim, post: Post) -> List[PersuasionAnnotation]:
+    """Annotations from techniques pre-labeled in the dataset."""
+    return [
+        PersuasionAnnotation(
+            technique_type=tech,
+            confidence=1.0,  # Ground truth
+            explanation="Labeled in FALCON dataset",
+            claim_id=claim.id
+        )
+        for tech in post.known_techniques
+    ]
+
+
+def _build_annotations(claim: Claim, techniques_data: List[Dict]) -> List[PersuasionAnnotation]:
+    """Convert parsed LLM technique records above the confidence threshold into annotations."""
+    return [
+        PersuasionAnnotation(
+            technique_type=tech["type"],
+            confidence=tech["confidence"],
+            explanation=tech.get("explanation", ""),
+            claim_id=claim.id
+        )
+        for tech in techniques_data
+        if tech.get("confidence", 0) >= Config.CONFIDENCE_THRESHOLD
+    ]
+
+
+async def detect_persuasion(
+    claim: Claim, post: Post, client, limiter: AsyncRateLimiter = None
+) -> List[PersuasionAnnotation]:
     """
     Detect persuasion techniques in a claim using LLM.
     """
@@ -268,78 +757,104 @@ def detect_persuasion(claim: Claim, post: Post, client) -> List[PersuasionAnnota
     
     # If post has known techniques (from FALCON), use them
     if post.known_techniques:
-        return [
-            PersuasionAnnotation(
-                technique_type=tech,
-                confidence=1.0,  # Ground truth
-                explanation="Labeled in FALCON dataset",
-                claim_id=claim.id
-            )
-            for tech in post.known_techniques
-        ]
+        return _known_annotations(claim, post)
+    
+    if not passes_persuasion_prefilter(post):
+        logger.debug(f"No loaded-language cues in post {post.post_id}, skipping LLM")
+        return []
     
     if client is None:
         logger.warning("LLM client not available, skipping persuasion detection")
         return []
     
-    taxonomy_str = "\n".join([f"- {k}: {v}" for k, v in PERSUASION_TAXONOMY.items()])
+    cache_key = (_text_digest(claim.text), _text_digest(post.text))
+    cached = _get_cached_records("persuasion", *cache_key)
+    if cached is not None:
+        return _build_annotations(claim, cached)
     
-    prompt = f"""Analyze this claim for persuasion techniques.
-
-Claim: {claim.text}
-Full Post Context: {post.text}
-
-Available techniques:
-{taxonomy_str}
-
-Return ONLY valid JSON:
-{{
-  "techniques": [
-    {{
-      "type": "TechniqueName",
-      "confidence": 0.85,
-      "explanation": "Why this technique applies"
-    }}
-  ]
-}}"""
+    prompt = PERSUASION_TEMPLATE.substitute(claim_text=claim.text, post_text=post.text)
     
     try:
-        response = client.chat.completions.create(
-            model=Config.LLM_MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert in rhetoric and propaganda analysis. Always respond with valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1
+        result = await _chat_json(
+            client, limiter, PERSUASION_SYSTEM_PROMPT, prompt, temperature=0.1,
+            response_format=PERSUASION_RESPONSE_FORMAT
         )
+        records = result.get("techniques", [])
+        _cache_records("persuasion", records, *cache_key)
+        return _build_annotations(claim, records)
         
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
-        
-        result = json.loads(content)
-        techniques_list = []
-        
-        for tech in result.get("techniques", []):
-            if tech.get("confidence", 0) >= Config.CONFIDENCE_THRESHOLD:
-                annotation = PersuasionAnnotation(
-                    technique_type=tech["type"],
-                    confidence=tech["confidence"],
-                    explanation=tech.get("explanation", ""),
-                    claim_id=claim.id
-                )
-                techniques_list.append(annotation)
-        
-        return techniques_list
-        
+    except BatchRequestDeferred:
+        raise
     except Exception as e:
         logger.error(f"Error detecting persuasion: {e}")
         return []
 
 
+async def detect_persuasion_batch(
+    claims: List[Claim], posts: List[Post], client, limiter: AsyncRateLimiter = None
+) -> List[List[PersuasionAnnotation]]:
+    """
+    Detect persuasion techniques for several claims with a single LLM call
+    (row marshaling). `posts[i]` is the source post of `claims[i]`.
+    Returns one annotation list per claim. Claims whose techniques are cached
+    from an earlier run are left out of the prompt. Claims missing from the
+    response, or all claims if the response cannot be parsed, are retried with
+    detect_persuasion.
+    """
+    annotations: Dict[int, List[PersuasionAnnotation]] = {}
+    pending = []
+    for idx, (claim, post) in enumerate(zip(claims, posts)):
+        if post.known_techniques or client is None or not passes_persuasion_prefilter(post):
+            annotations[idx] = await detect_persuasion(claim, post, client, limiter)
+            continue
+        cached = _get_cached_records("persuasion", _text_digest(claim.text), _text_digest(post.text))
+        if cached is not None:
+            annotations[idx] = _build_annotations(claim, cached)
+        else:
+            pending.append(idx)
+    
+    if len(pending) > 1:
+        logger.info(f"Detecting persuasion in {len(pending)} claims: {claims[pending[0]].id} .. {claims[pending[-1]].id}")
+        
+        # Claims are listed under their post, so each post's text is sent once
+        rows_by_post: Dict[str, List[int]] = {}
+        for row, idx in enumerate(pending):
+            rows_by_post.setdefault(posts[idx].post_id, []).append(row)
+        claims_block = "\n\n".join(
+            f"Post: {posts[pending[rows[0]]].text}\n"
+            + "\n".join(f"Claim {row}: {claims[pending[row]].text}" for row in rows)
+            for rows in rows_by_post.values()
+        )
+        prompt = PERSUASION_BATCH_TEMPLATE.substitute(claims_block=claims_block)
+        
+        try:
+            result = await _chat_json(
+                client, limiter, PERSUASION_SYSTEM_PROMPT, prompt, temperature=0.1,
+                response_format=PERSUASION_BATCH_RESPONSE_FORMAT
+            )
+            for r in result["results"]:
+                row = int(r["claim_idx"])
+                if 0 <= row < len(pending):
+                    idx = pending[row]
+                    records = r.get("techniques", [])
+                    _cache_records(
+                        "persuasion", records, _text_digest(claims[idx].text), _text_digest(posts[idx].text)
+                    )
+                    annotations[idx] = _build_annotations(claims[idx], records)
+        except BatchRequestDeferred:
+            raise
+        except Exception as e:
+            logger.warning(f"Batched persuasion detection failed ({e}), retrying per claim")
+    
+    missing = [idx for idx in pending if idx not in annotations]
+    retried = await asyncio.gather(
+        *(detect_persuasion(claims[idx], posts[idx], client, limiter) for idx in missing)
+    )
+    annotations.update(zip(missing, retried))
+    
+    return [annotations[idx] for idx in range(len(claims))]
+
+
 # ========================================
 # Stage 3: Entity Recognition & Linking
 # ========================================
@@ -362,55 +877,201 @@ LABEL_MAPPING = {
 VALID_ENTITY_CLASSES = {"Person", "Organization", "Location", "Event"}
 
 WIKIDATA_ENDPOINT = "https://query.wikidata.org/sparql"
+# WDQS throttles requests without a descriptive User-Agent
+WIKIDATA_USER_AGENT = "persuasion-muse-pipeline/1.0 (https://github.com/Farmerobot/semantic_web_project)"
+WIKIDATA_BULK_SIZE = 50  # Labels per VALUES query
+WIKIDATA_MAX_WORKERS = 4  # Concurrent VALUES queries (WDQS allows 5 per client)
+WIKIDATA_CACHE_TTL = 30 * 24 * 3600  # Seconds to keep resolved IDs
+WIKIDATA_NEGATIVE_TTL = 7 * 24 * 3600  # Seconds to remember names with no match
+
+
+def _make_wikidata_session() -> requests.Session:
+    """HTTP session with connection pooling and retry/backoff on 429/5xx."""
+    session = requests.Session()
+    session.headers["User-Agent"] = WIKIDATA_USER_AGENT
+    retry = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"})  # SPARQL queries are read-only
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Reused for all Wikidata queries, so TCP/TLS connections are kept alive
+WIKIDATA_SESSION = _make_wikidata_session()
+
+
+def _query_wikidata(query: str) -> List[Dict]:
+    """POST a SPARQL query to Wikidata and return the result bindings."""
+    response = WIKIDATA_SESSION.post(
+        WIKIDATA_ENDPOINT,
+        data={"query": query},
+        headers={"Accept": "application/sparql-results+json"},
+        timeout=30
+    )
+    response.raise_for_status()
+    return json_loads(response.content)["results"]["bindings"]
+
+
+def _sparql_label(name: str) -> str:
+    """English SPARQL string literal for a label, with quotes and control characters escaped."""
+    return json.dumps(name, ensure_ascii=False) + "@en"
+
+
+# Type constraints applied to Wikidata candidates per ontology entity class
+WIKIDATA_TYPE_FILTERS = {
+    "Person": "?item wdt:P31 wd:Q5 .",  # instance of human
+    "Organization": "?item wdt:P31/wdt:P279* wd:Q43229 .",  # instance of organization
+    "Location": "?item wdt:P31/wdt:P279* wd:Q618123 .",  # geographical feature
+}
+
+
+def _wikidata_cache_key(entity_name: str, entity_type: Optional[str]) -> str:
+    """Cache key for a lookup; names are NFKC-normalized and casefolded."""
+    return ResponseCache.make_key(unicodedata.normalize("NFKC", entity_name).casefold(), entity_type)
+
+
+# In-process copy of lookup results ("" for misses), so names that recur across
+# claims and batches of a run are resolved without touching the disk cache
+_wikidata_memo: Dict[str, str] = {}
+
+
+def _get_cached_wikidata_id(cache: Optional[ResponseCache], key: str) -> Optional[str]:
+    """Return the cached lookup result ("" for a known miss), or None if not cached."""
+    cached = _wikidata_memo.get(key)
+    if cached is None and cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            _wikidata_memo[key] = cached
+    return cached
+
+
+def _cache_wikidata_result(cache: Optional[ResponseCache], key: str, wikidata_id: Optional[str]):
+    """Cache a lookup result; misses are stored as "" with a shorter TTL."""
+    _wikidata_memo[key] = wikidata_id or ""
+    if cache is None:
+        return
+    if wikidata_id:
+        cache.set(key, wikidata_id, ttl=WIKIDATA_CACHE_TTL)
+    else:
+        cache.set(key, "", ttl=WIKIDATA_NEGATIVE_TTL)
 
 
 def find_wikidata_entity(entity_name: str, entity_type: str = None) -> Optional[str]:
     """
     Search Wikidata for an entity by name and return Wikidata ID.
+    Results, including misses, are cached on disk keyed by the normalized
+    (entity_name, entity_type).
     """
-    sparql = SPARQLWrapper(WIKIDATA_ENDPOINT)
-    sparql.setReturnFormat(JSON)
+    cache = get_cache("wikidata")
+    key = _wikidata_cache_key(entity_name, entity_type)
+    cached = _get_cached_wikidata_id(cache, key)
+    if cached is not None:
+        return cached or None
     
     # Build query with optional type filter
-    type_filter = ""
-    if entity_type == "Person":
-        type_filter = "?item wdt:P31 wd:Q5 ."  # instance of human
-    elif entity_type == "Organization":
-        type_filter = "?item wdt:P31/wdt:P279* wd:Q43229 ."  # instance of organization
-    elif entity_type == "Location":
-        type_filter = "?item wdt:P31/wdt:P279* wd:Q618123 ."  # geographical feature
+    type_filter = WIKIDATA_TYPE_FILTERS.get(entity_type, "")
     
     query = f"""
     SELECT ?item WHERE {{
-        ?item rdfs:label "{entity_name}"@en .
+        ?item rdfs:label {_sparql_label(entity_name)} .
         {type_filter}
     }}
     LIMIT 1
     """
     
     try:
-        sparql.setQuery(query)
-        results = sparql.query().convert()
-        
-        if results["results"]["bindings"]:
-            result = results["results"]["bindings"][0]
-            return result["item"]["value"].split("/")[-1]
+        bindings = _query_wikidata(query)
+        wikidata_id = bindings[0]["item"]["value"].split("/")[-1] if bindings else None
+        _cache_wikidata_result(cache, key, wikidata_id)
+        return wikidata_id
     except Exception as e:
         logger.debug(f"Wikidata query failed for {entity_name}: {e}")
     
     return None
 
 
-def extract_and_link_entities(claim: Claim, post: Post, nlp) -> List[Entity]:
+def find_wikidata_entities_bulk(entities: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
     """
-    Extract named entities using spaCy and link to Wikidata.
+    Resolve many (entity_name, entity_type) pairs with one SPARQL query per
+    entity type and chunk of WIKIDATA_BULK_SIZE labels, using a VALUES clause.
+    Returns a mapping from (entity_name, entity_type) to Wikidata ID for
+    resolved entities; only cache misses are sent to Wikidata. Spellings that
+    share a normalized cache key (e.g. "Trump" and "TRUMP") are all queried
+    and resolve to the same ID if any of them matches.
     """
-    logger.info(f"Extracting entities from claim: {claim.id}")
+    cache = get_cache("wikidata")
+    resolved: Dict[Tuple[str, str], str] = {}
+    names_by_type: Dict[str, List[str]] = defaultdict(list)
+    # Uncached cache key -> the (entity_name, entity_type) spellings sharing it
+    variants_by_key: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
     
-    if nlp is None:
-        return []
+    for entity_name, entity_type in dict.fromkeys(entities):
+        key = _wikidata_cache_key(entity_name, entity_type)
+        cached = _get_cached_wikidata_id(cache, key)
+        if cached is None:
+            names_by_type[entity_type].append(entity_name)
+            variants_by_key[key].append((entity_name, entity_type))
+        elif cached:
+            resolved[(entity_name, entity_type)] = cached
+    
+    chunks = [
+        (entity_type, names[i:i + WIKIDATA_BULK_SIZE])
+        for entity_type, names in names_by_type.items()
+        for i in range(0, len(names), WIKIDATA_BULK_SIZE)
+    ]
+    if not chunks:
+        return resolved
     
-    doc = nlp(claim.text)
+    def query_chunk(entity_type: str, chunk: List[str]) -> Optional[List[Dict]]:
+        values = " ".join(_sparql_label(name) for name in chunk)
+        query = f"""
+        SELECT ?label (SAMPLE(?item) AS ?entity) WHERE {{
+            VALUES ?label {{ {values} }}
+            ?item rdfs:label ?label .
+            {WIKIDATA_TYPE_FILTERS.get(entity_type, "")}
+        }}
+        GROUP BY ?label
+        """
+        try:
+            return _query_wikidata(query)
+        except Exception as e:
+            logger.debug(f"Wikidata bulk query failed for {len(chunk)} {entity_type} labels: {e}")
+            return None
+    
+    found: Dict[Tuple[str, str], str] = {}
+    failed: set = set()
+    
+    # Chunks are queried concurrently; WDQS allows only a few parallel queries per client
+    with ThreadPoolExecutor(max_workers=min(WIKIDATA_MAX_WORKERS, len(chunks))) as executor:
+        chunk_results = executor.map(lambda args: query_chunk(*args), chunks)
+        for (entity_type, chunk), bindings in zip(chunks, chunk_results):
+            if bindings is None:
+                failed.update((entity_name, entity_type) for entity_name in chunk)
+                continue
+            for binding in bindings:
+                found[(binding["label"]["value"], entity_type)] = binding["entity"]["value"].split("/")[-1]
+    
+    # Results are cached once per normalized key: a hit for any spelling
+    # applies to all of them, and a miss is stored only if every spelling was
+    # queried successfully (failed queries are retried on the next run)
+    for key, variants in variants_by_key.items():
+        wikidata_id = next((found[v] for v in variants if v in found), None)
+        if wikidata_id:
+            resolved.update((v, wikidata_id) for v in variants)
+        elif any(v in failed for v in variants):
+            continue
+        _cache_wikidata_result(cache, key, wikidata_id)
+    
+    return resolved
+
+
+def _entities_from_doc(claim: Claim, doc) -> List[Entity]:
+    """Convert the spaCy entities of a claim's doc into (unlinked) Entity objects."""
     entities_list = []
     seen = set()
     
@@ -422,13 +1083,9 @@ def extract_and_link_entities(claim: Claim, post: Post, nlp) -> List[Entity]:
             if entity_type not in VALID_ENTITY_CLASSES:
                 entity_type = "Entity"
             
-            # Try to find Wikidata ID
-            wikidata_id = find_wikidata_entity(ent.text, entity_type)
-            
             entity = Entity(
                 name=ent.text,
                 type=entity_type,
-                wikidata_id=wikidata_id,
                 claim_id=claim.id
             )
             entities_list.append(entity)
@@ -436,6 +1093,71 @@ def extract_and_link_entities(claim: Claim, post: Post, nlp) -> List[Entity]:
     return entities_list
 
 
+def extract_entities(claim: Claim, nlp) -> List[Entity]:
+    """
+    Extract named entities from a claim using spaCy (without Wikidata linking).
+    """
+    logger.info(f"Extracting entities from claim: {claim.id}")
+    
+    if nlp is None:
+        return []
+    
+    return _entities_from_doc(claim, nlp(claim.text))
+
+
+def extract_entities_batch(claims: List[Claim], nlp) -> List[List[Entity]]:
+    """
+    Extract named entities from many claims in one streamed nlp.pipe pass.
+    Claims with identical text are parsed once. Returns one entity list per claim.
+    """
+    if nlp is None or not claims:
+        return [[] for _ in claims]
+    
+    texts = list(dict.fromkeys(claim.text for claim in claims))
+    logger.info(f"Extracting entities from {len(claims)} claims ({len(texts)} distinct)")
+    docs = dict(zip(texts, nlp.pipe(
+        texts,
+        batch_size=Config.NLP_BATCH_SIZE,
+        n_process=Config.NLP_PROCESSES
+    )))
+    return [_entities_from_doc(claim, docs[claim.text]) for claim in claims]
+
+
+def link_entities(entities: List[Entity]) -> List[Entity]:
+    """
+    Attach Wikidata IDs to entities in place, resolving all of them in bulk.
+    """
+    resolved = find_wikidata_entities_bulk([(e.name, e.type) for e in entities])
+    for entity in entities:
+        entity.wikidata_id = resolved.get((entity.name, entity.type))
+    return entities
+
+
+def extract_and_link_entities(claim: Claim, post: Post, nlp) -> List[Entity]:
+    """
+    Extract named entities using spaCy and link to Wikidata.
+    """
+    return link_entities(extract_entities(claim, nlp))
+
+
+def extract_and_link_entities_batch(claims: List[Claim], nlp) -> List[List[Entity]]:
+    """
+    Extract named entities from many claims with nlp.pipe and link them to
+    Wikidata with one bulk lookup; names repeated across claims are resolved once.
+    Returns one entity list per claim.
+    """
+    entities_per_claim = extract_entities_batch(claims, nlp)
+    link_entities([entity for entities in entities_per_claim for entity in entities])
+    return entities_per_claim
+
+
+@lru_cache(maxsize=4096)
+def _text_polarity(text: str) -> float:
+    """TextBlob polarity of a text, memoized since reposted texts recur across batches."""
+    # Try using TextBlob for sentiment (more accurate)
+    return TextBlob(text).sentiment.polarity
+
+
 def analyze_sentiment(text: str, nlp) -> tuple:
     """
     Analyze sentiment of text. Returns (sentiment_class, sentiment_score).
@@ -445,10 +1167,24 @@ def analyze_sentiment(text: str, nlp) -> tuple:
     if nlp is None:
         return "NeutralSentiment", 0.0
 
-    # Try using TextBlob for sentiment (more accurate)
-    blob = TextBlob(text)
-    score = blob.sentiment.polarity  # -1 to 1
+    score = _text_polarity(text)  # -1 to 1
+    return _sentiment_class(score)
+
+
+def analyze_sentiment_batch(texts: List[str], nlp, executor: Optional[Executor] = None) -> List[tuple]:
+    """
+    analyze_sentiment for many texts. Scores are computed on `executor`
+    (e.g. a process pool, to use several cores) when one is given.
+    """
+    if nlp is None:
+        return [("NeutralSentiment", 0.0)] * len(texts)
     
+    scores = executor.map(_text_polarity, texts, chunksize=32) if executor else map(_text_polarity, texts)
+    return [_sentiment_class(score) for score in scores]
+
+
+def _sentiment_class(score: float) -> tuple:
+    """Map a polarity score to (sentiment_class, rounded score)."""
     if score > 0.1:
         sentiment_class = "PositiveSentiment"
     elif score < -0.1:
@@ -484,106 +1220,235 @@ def verify_claim(claim: Claim) -> VerificationResult:
 # Stage 5: RDF Generation
 # ========================================
 
+PERSUASION = Namespace("http://example.org/persuasion#")
+WD = Namespace("http://www.wikidata.org/entity/")
+PROV = Namespace("http://www.w3.org/ns/prov#")
+POST_NS = Namespace("http://example.org/post#")
+CLAIM_NS = Namespace("http://example.org/claim#")
+ANNOTATION_NS = Namespace("http://example.org/annotation#")
+ENTITY_NS = Namespace("http://example.org/entity#")
+AGENT_URI = URIRef("http://example.org/agent#MUSE_Pipeline")
+
+# N-Triples forms of the fixed terms, so triples are emitted by plain string formatting
+NT_RDF_TYPE = f"<{RDF.type}>"
+NT_XSD_STRING = f"<{XSD.string}>"
+NT_XSD_FLOAT = f"<{XSD.float}>"
+NT_XSD_DATETIME = f"<{XSD.dateTime}>"
+NT_PROV_GENERATED_BY = f"<{PROV.wasGeneratedBy}>"
+NT_AGENT = f"<{AGENT_URI}>"
+
+# Persuasion classes, properties and technique/sentiment/status URIs repeat across claims, so format each once
+_persuasion_terms: Dict[str, str] = {}
+
+
+def persuasion_term(name: str) -> str:
+    """Return the (memoized) N-Triples form of a term in the persuasion namespace."""
+    term = _persuasion_terms.get(name)
+    if term is None:
+        term = _persuasion_terms[name] = f"<{PERSUASION[name]}>"
+    return term
+
+
+# Entity names recur across claims and posts, so their URIs are also formatted once
+_entity_terms: Dict[str, str] = {}
+
+
+def entity_term(name: str) -> str:
+    """
+    Return the (memoized) N-Triples URI of a named entity. Spaces become
+    underscores and all other reserved or non-ASCII characters are
+    percent-encoded, so names containing '/', '#' or '.' stay distinct.
+    """
+    term = _entity_terms.get(name)
+    if term is None:
+        term = _entity_terms[name] = f"<{ENTITY_NS}{quote(name.replace(' ', '_'), safe='')}>"
+    return term
+
+
+def _nt_literal(value, datatype: Optional[str] = None) -> str:
+    """Format a value as an N-Triples literal, optionally typed with an N-Triples datatype URI."""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"')
+               .replace("\n", "\\n").replace("\r", "\\r"))
+    return f'"{escaped}"^^{datatype}' if datatype else f'"{escaped}"'
+
+
 def generate_rdf_triples(
     post: Post,
     claims: List[Claim],
     techniques: List[PersuasionAnnotation],
     entities: List[Entity],
     verifications: List[VerificationResult],
-    nlp=None
-) -> Graph:
+    nlp=None,
+    emitted: Optional[set] = None,
+    sentiment: Optional[tuple] = None
+) -> List[str]:
     """
-    Generate RDF triples from annotations.
+    Generate RDF triples from annotations as N-Triples lines. Lines are built
+    as strings from pre-formatted terms, without rdflib terms or a per-post Graph.
+    Entity and agent descriptions recur across claims and posts; their lines are
+    skipped if already in `emitted` (pass one set per output file). `sentiment`
+    is the post's precomputed analyze_sentiment result, if available.
     """
     logger.info(f"Generating RDF triples for post: {post.post_id}")
+    P = persuasion_term
+    lines = []
+    add = lines.append
+    if emitted is None:
+        emitted = set()
     
-    g = Graph()
-    
-    # Define namespaces
-    PERSUASION = Namespace("http://example.org/persuasion#")
-    WD = Namespace("http://www.wikidata.org/entity/")
-    PROV = Namespace("http://www.w3.org/ns/prov#")
-    
-    g.bind("persuasion", PERSUASION)
-    g.bind("wd", WD)
-    g.bind("prov", PROV)
+    def add_shared(line: str):
+        if line not in emitted:
+            emitted.add(line)
+            add(line)
     
     # Create post node
-    post_uri = URIRef(f"http://example.org/post#{post.post_id}")
-    g.add((post_uri, RDF.type, PERSUASION.Post))
-    g.add((post_uri, PERSUASION.postId, Literal(post.post_id, datatype=XSD.string)))
-    g.add((post_uri, PERSUASION.hasText, Literal(post.text, datatype=XSD.string)))
-    g.add((post_uri, PERSUASION.platform, Literal(post.platform, datatype=XSD.string)))
+    post_uri = f"<{POST_NS}{post.post_id}>"
+    add(f"{post_uri} {NT_RDF_TYPE} {P('Post')} .\n")
+    add(f"{post_uri} {P('postId')} {_nt_literal(post.post_id, NT_XSD_STRING)} .\n")
+    add(f"{post_uri} {P('hasText')} {_nt_literal(post.text, NT_XSD_STRING)} .\n")
+    add(f"{post_uri} {P('platform')} {_nt_literal(post.platform, NT_XSD_STRING)} .\n")
     
     if post.timestamp:
-        g.add((post_uri, PERSUASION.timestamp, 
-               Literal(post.timestamp, datatype=XSD.dateTime)))
+        # Go through rdflib for the canonical xsd:dateTime lexical form
+        timestamp = Literal(post.timestamp, datatype=XSD.dateTime)
+        add(f"{post_uri} {P('timestamp')} {_nt_literal(timestamp, NT_XSD_DATETIME)} .\n")
     
     # Add sentiment analysis for post
-    sentiment_class, sentiment_score = analyze_sentiment(post.text, nlp)
-    sentiment_uri = URIRef(f"http://example.org/persuasion#{sentiment_class}")
-    g.add((post_uri, PERSUASION.hasSentiment, sentiment_uri))
-    g.add((post_uri, PERSUASION.sentimentScore, Literal(sentiment_score, datatype=XSD.float)))
+    sentiment_class, sentiment_score = sentiment or analyze_sentiment(post.text, nlp)
+    add(f"{post_uri} {P('hasSentiment')} {P(sentiment_class)} .\n")
+    add(f"{post_uri} {P('sentimentScore')} {_nt_literal(sentiment_score, NT_XSD_FLOAT)} .\n")
+    
+    # Index annotations by claim once instead of filtering the full lists per claim
+    techniques_by_claim = defaultdict(list)
+    for technique in techniques:
+        techniques_by_claim[technique.claim_id].append(technique)
+    entities_by_claim = defaultdict(list)
+    for entity in entities:
+        entities_by_claim[entity.claim_id].append(entity)
+    verification_by_claim = {}
+    for verification in verifications:
+        verification_by_claim.setdefault(verification.claim_id, verification)
     
     # Add claims
     for claim in claims:
-        claim_uri = URIRef(f"http://example.org/claim#{claim.id}")
-        g.add((claim_uri, RDF.type, PERSUASION.Claim))
-        g.add((claim_uri, PERSUASION.claimText, Literal(claim.text)))
+        claim_uri = f"<{CLAIM_NS}{claim.id}>"
+        add(f"{claim_uri} {NT_RDF_TYPE} {P('Claim')} .\n")
+        add(f"{claim_uri} {P('claimText')} {_nt_literal(claim.text)} .\n")
         
         # Link claim to post
-        g.add((post_uri, PERSUASION.containsClaim, claim_uri))
+        add(f"{post_uri} {P('containsClaim')} {claim_uri} .\n")
         
         # Add persuasion techniques via PersuasionAnnotation (reification pattern)
-        claim_techniques = [t for t in techniques if t.claim_id == claim.id]
-        for idx, technique in enumerate(claim_techniques):
+        for idx, technique in enumerate(techniques_by_claim[claim.id]):
             # Create annotation instance to link claim, technique, and confidence
-            annotation_uri = URIRef(f"http://example.org/annotation#{claim.id}_tech_{idx}")
-            technique_uri = URIRef(f"http://example.org/persuasion#{technique.technique_type}")
+            annotation_uri = f"<{ANNOTATION_NS}{claim.id}_tech_{idx}>"
             
-            g.add((annotation_uri, RDF.type, PERSUASION.PersuasionAnnotation))
-            g.add((claim_uri, PERSUASION.hasAnnotation, annotation_uri))
-            g.add((annotation_uri, PERSUASION.annotatesTechnique, technique_uri))
-            g.add((annotation_uri, PERSUASION.confidenceScore, 
-                   Literal(technique.confidence, datatype=XSD.float)))
+            add(f"{annotation_uri} {NT_RDF_TYPE} {P('PersuasionAnnotation')} .\n")
+            add(f"{claim_uri} {P('hasAnnotation')} {annotation_uri} .\n")
+            add(f"{annotation_uri} {P('annotatesTechnique')} {P(technique.technique_type)} .\n")
+            add(f"{annotation_uri} {P('confidenceScore')} {_nt_literal(technique.confidence, NT_XSD_FLOAT)} .\n")
             if technique.explanation:
-                g.add((annotation_uri, PERSUASION.explanation, 
-                       Literal(technique.explanation, datatype=XSD.string)))
+                add(f"{annotation_uri} {P('explanation')} {_nt_literal(technique.explanation, NT_XSD_STRING)} .\n")
         
         # Add entities with proper subclass types
-        claim_entities = [e for e in entities if e.claim_id == claim.id]
-        for entity in claim_entities:
-            entity_uri = URIRef(f"http://example.org/entity#{entity.name.replace(' ', '_').replace('.', '_')}")
+        for entity in entities_by_claim[claim.id]:
+            entity_uri = entity_term(entity.name)
             
             # Use the specific entity subclass (Person, Organization, Location, Event) or Entity
-            entity_class = getattr(PERSUASION, entity.type, PERSUASION.Entity)
-            g.add((entity_uri, RDF.type, entity_class))
-            g.add((entity_uri, PERSUASION.entityName, Literal(entity.name, datatype=XSD.string)))
+            add_shared(f"{entity_uri} {NT_RDF_TYPE} {P(entity.type)} .\n")
+            add_shared(f"{entity_uri} {P('entityName')} {_nt_literal(entity.name, NT_XSD_STRING)} .\n")
             
             if entity.wikidata_id:
-                wikidata_uri = URIRef(f"http://www.wikidata.org/entity/{entity.wikidata_id}")
-                g.add((entity_uri, PERSUASION.linkedToWikidata, wikidata_uri))
+                add_shared(f"{entity_uri} {P('linkedToWikidata')} <{WD}{entity.wikidata_id}> .\n")
             
-            g.add((claim_uri, PERSUASION.targetsEntity, entity_uri))
+            add(f"{claim_uri} {P('targetsEntity')} {entity_uri} .\n")
         
         # Add verification
-        verification = next((v for v in verifications if v.claim_id == claim.id), None)
+        verification = verification_by_claim.get(claim.id)
         if verification:
-            status_uri = URIRef(f"http://example.org/persuasion#{verification.status}")
-            g.add((claim_uri, PERSUASION.hasVerificationStatus, status_uri))
+            add(f"{claim_uri} {P('hasVerificationStatus')} {P(verification.status)} .\n")
     
     # Add provenance
-    agent_uri = URIRef("http://example.org/agent#MUSE_Pipeline")
-    g.add((agent_uri, RDF.type, PERSUASION.LLMAgent))
-    g.add((agent_uri, PERSUASION.modelName, Literal(Config.LLM_MODEL)))
-    g.add((post_uri, PROV.wasGeneratedBy, agent_uri))
+    add_shared(f"{NT_AGENT} {NT_RDF_TYPE} {P('LLMAgent')} .\n")
+    add_shared(f"{NT_AGENT} {P('modelName')} {_nt_literal(Config.LLM_MODEL)} .\n")
+    add(f"{post_uri} {NT_PROV_GENERATED_BY} {NT_AGENT} .\n")
     
-    return g
+    return lines
+
 
+NT_WRITE_BUFFER = 1 << 20  # Bytes buffered before the N-Triples output file is written
 
-def serialize_rdf(graph: Graph, output_format: str = "turtle") -> str:
+
+def _make_cpu_pool():
+    """Process pool for CPU-bound per-post work, or a null context if Config.CPU_WORKERS <= 1."""
+    if Config.CPU_WORKERS <= 1:
+        return nullcontext()
+    # forkserver children are forked from a clean server process, not from the
+    # threaded main process, and do not re-import the module for every task
+    return ProcessPoolExecutor(
+        max_workers=Config.CPU_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver")
+    )
+
+
+def write_ntriples(lines: List[str], sink) -> int:
+    """Write N-Triples lines to an open text file. Returns the number of triples written."""
+    sink.writelines(lines)
+    return len(lines)
+
+
+def _jsonld_term(term) -> Dict:
+    """Expanded JSON-LD form of an RDF object term."""
+    if isinstance(term, Literal):
+        node = {"@value": str(term)}
+        if term.language:
+            node["@language"] = term.language
+        elif term.datatype:
+            node["@type"] = str(term.datatype)
+        return node
+    return {"@id": f"_:{term}" if isinstance(term, BNode) else str(term)}
+
+
+def graph_to_jsonld(graph: Graph) -> List[Dict]:
+    """
+    Expanded JSON-LD node objects for a graph, built in one pass over its
+    triples (rdflib's JSON-LD serializer is far slower on large graphs).
     """
-    Serialize RDF graph to file.
+    nodes: Dict = {}
+    for s, p, o in graph:
+        node = nodes.get(s)
+        if node is None:
+            node = nodes[s] = {"@id": f"_:{s}" if isinstance(s, BNode) else str(s)}
+        if p == RDF.type and not isinstance(o, Literal):
+            node.setdefault("@type", []).append(_jsonld_term(o)["@id"])
+        else:
+            node.setdefault(str(p), []).append(_jsonld_term(o))
+    return list(nodes.values())
+
+
+def _serialize_turtle_oxigraph(graph: Graph, sources: List[Path], output_file: Path):
+    """
+    Write the triples of the given Turtle/N-Triples files as Turtle with
+    pyoxigraph, using the namespace prefixes bound in `graph`.
+    """
+    store = pyoxigraph.Store()
+    for source in sources:
+        store.bulk_load(path=str(source), format=pyoxigraph.RdfFormat.from_extension(source.suffix[1:]))
+    store.dump(
+        str(output_file),
+        format=pyoxigraph.RdfFormat.TURTLE,
+        from_graph=pyoxigraph.DefaultGraph(),
+        prefixes={prefix: str(namespace) for prefix, namespace in graph.namespaces()}
+    )
+
+
+def serialize_rdf(graph: Graph, output_format: str = "turtle",
+                  sources: Optional[List[Path]] = None) -> str:
+    """
+    Serialize RDF graph to file. JSON-LD is written in expanded form by
+    graph_to_jsonld; other formats use rdflib's serializers. If pyoxigraph is
+    installed and the files `graph` was parsed from are given as `sources`,
+    Turtle is written by pyoxigraph from those files instead.
     """
     output_dir = Path(Config.OUTPUT_DIR)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -591,7 +1456,12 @@ def serialize_rdf(graph: Graph, output_format: str = "turtle") -> str:
     ext = "ttl" if output_format == "turtle" else output_format
     output_file = output_dir / f"annotated_posts.{ext}"
     
-    graph.serialize(destination=str(output_file), format=output_format)
+    if output_format == "json-ld":
+        json_dump_file(graph_to_jsonld(graph), output_file)
+    elif output_format == "turtle" and sources and pyoxigraph is not None:
+        _serialize_turtle_oxigraph(graph, sources, output_file)
+    else:
+        graph.serialize(destination=str(output_file), format=output_format)
     logger.info(f"Serialized RDF to: {output_file}")
     
     return str(output_file)
@@ -601,16 +1471,30 @@ def serialize_rdf(graph: Graph, output_format: str = "turtle") -> str:
 # Main Pipeline Orchestration
 # ========================================
 
+NDJSON_SUFFIXES = {".jsonl", ".ndjson"}
+
+
+def _iter_post_records(input_file: str):
+    """
+    Yield post records from a JSON array file, or stream them line by line
+    from a line-delimited JSON (.jsonl/.ndjson) file.
+    """
+    with open(input_file, 'rb') as f:
+        if Path(input_file).suffix in NDJSON_SUFFIXES:
+            for line in f:
+                if line.strip():
+                    yield json_loads(line)
+        else:
+            yield from json_loads(f.read())
+
+
 def load_posts_from_falcon(input_file: str, max_posts: int = None) -> List[Post]:
-    """Load posts from processed FALCON JSON file."""
-    with open(input_file, 'r', encoding='utf-8') as f:
-        posts_data = json.load(f)
-    
-    if max_posts:
-        posts_data = posts_data[:max_posts]
-    
+    """
+    Load posts from processed FALCON JSON file. Line-delimited JSON input is
+    read only up to max_posts.
+    """
     posts = []
-    for item in posts_data:
+    for item in islice(_iter_post_records(input_file), max_posts or None):
         post = Post(
             post_id=item["post_id"],
             text=item.get("text_clean", item.get("text", "")),
@@ -622,13 +1506,222 @@ def load_posts_from_falcon(input_file: str, max_posts: int = None) -> List[Post]
     return posts
 
 
-def main_pipeline(use_falcon: bool = True, max_posts: int = None):
+def _run_sync(coro):
+    """
+    Run a coroutine to completion (on uvloop when installed), also when called
+    from a running event loop (e.g. Jupyter).
+    """
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro, loop_factory=loop_factory)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro, loop_factory=loop_factory).result()
+
+
+def main_pipeline(use_falcon: bool = True, max_posts: int = None, batch_mode: bool = False,
+                  resume: bool = False):
     """Main pipeline orchestration."""
+    return _run_sync(run_pipeline(use_falcon, max_posts, batch_mode, resume))
+
+
+def _post_dedup_key(post: Post) -> Tuple[bytes, Tuple[str, ...]]:
+    """Posts with equal keys (same text and FALCON labels) get the same annotations."""
+    return hashlib.blake2b(post.text.encode("utf-8"), digest_size=16).digest(), tuple(post.known_techniques)
+
+
+def _copy_post_annotations(
+    source: Post, target: Post, claims: List[Claim],
+    techniques: List[PersuasionAnnotation], entities: List[Entity]
+) -> Tuple[List[Claim], List[PersuasionAnnotation], List[Entity]]:
+    """Copy the annotations of a post to a duplicate post, retagging the claim IDs."""
+    claim_ids = {claim.id: target.post_id + claim.id[len(source.post_id):] for claim in claims}
+    return (
+        [replace(claim, id=claim_ids[claim.id], source_post=target.post_id) for claim in claims],
+        [replace(t, claim_id=claim_ids[t.claim_id]) for t in techniques],
+        [replace(e, claim_id=claim_ids[e.claim_id]) for e in entities],
+    )
+
+
+def _dedupe_posts(batch: List[Post]) -> Tuple[List[Post], List[int]]:
+    """
+    Return the distinct posts of a batch and, for every post of the batch,
+    the position of its representative in that list.
+    """
+    unique_posts: List[Post] = []
+    unique_pos: Dict[Tuple, int] = {}
+    post_pos = []
+    for post in batch:
+        key = _post_dedup_key(post)
+        if key not in unique_pos:
+            unique_pos[key] = len(unique_posts)
+            unique_posts.append(post)
+        post_pos.append(unique_pos[key])
+    return unique_posts, post_pos
+
+
+async def _extract_claims_rows(posts: List[Post], client, limiter: AsyncRateLimiter) -> List[List[Claim]]:
+    """Stage 1 for a batch: several posts per LLM call, calls issued concurrently."""
+    rows = Config.LLM_ROWS_PER_CALL
+    claim_groups = await asyncio.gather(
+        *(extract_claims_batch(posts[j:j + rows], client, limiter)
+          for j in range(0, len(posts), rows))
+    )
+    return [claims for group in claim_groups for claims in group]
+
+
+async def _detect_persuasion_rows(
+    claim_refs: List[Tuple[int, Claim]], posts: List[Post], client, limiter: AsyncRateLimiter
+) -> List[List[PersuasionAnnotation]]:
+    """Stage 2 for a batch: several claims per LLM call, calls issued concurrently."""
+    rows = Config.LLM_ROWS_PER_CALL
+    technique_groups = await asyncio.gather(
+        *(detect_persuasion_batch(
+            [claim for _, claim in claim_refs[j:j + rows]],
+            [posts[post_idx] for post_idx, _ in claim_refs[j:j + rows]],
+            client, limiter)
+          for j in range(0, len(claim_refs), rows))
+    )
+    return [techniques for group in technique_groups for techniques in group]
+
+
+def _claim_refs(batch_claims: List[List[Claim]]) -> List[Tuple[int, Claim]]:
+    """Flatten per-post claim lists into (post index, claim) pairs."""
+    return [(post_idx, claim) for post_idx, claims in enumerate(batch_claims) for claim in claims]
+
+
+async def run_batch_job(client, requests: Dict[str, Dict], name: str) -> int:
+    """
+    Submit chat requests as one Batch API job, wait for it to finish and store
+    the responses that parse in the LLM cache under their request keys.
+    Returns the number of cached responses; requests that failed or are
+    missing from the output are left to the regular path.
+    
+    The job ID is recorded in the cache directory until the results are
+    stored, so a run interrupted while waiting resumes the same job instead
+    of submitting (and paying for) the requests again.
+    """
+    cache = get_cache("llm")
+    state_file = Path(Config.CACHE_DIR) / f"batch_{name}.json"
+    requests_digest = hashlib.sha256("\n".join(sorted(requests)).encode("utf-8")).hexdigest()
+    
+    job = None
+    if state_file.exists():
+        state = json_loads(state_file.read_bytes())
+        if state.get("requests") == requests_digest:
+            job = await client.batches.retrieve(state["job_id"])
+            if job.status in ("failed", "expired", "cancelled"):
+                job = None
+            else:
+                logger.info(f"Resuming batch job {job.id} ({job.status}) for {len(requests)} {name} requests")
+    
+    if job is None:
+        batch_in = Path(Config.CACHE_DIR) / f"batch_in_{name}.jsonl"
+        with open(batch_in, 'w', encoding='utf-8') as f:
+            # Requests sharing a prompt prefix are written next to each other
+            for key, body in sorted(requests.items(), key=lambda item: item[1]["messages"][-1]["content"]):
+                f.write(json_dumps({"custom_id": key, "method": "POST", "url": "/v1/chat/completions", "body": body}) + "\n")
+        
+        input_file = await client.files.create(file=batch_in, purpose="batch")
+        job = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        json_dump_file({"job_id": job.id, "requests": requests_digest}, state_file)
+        logger.info(f"Submitted batch job {job.id} with {len(requests)} {name} requests")
+    
+    while job.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(Config.BATCH_POLL_INTERVAL)
+        job = await client.batches.retrieve(job.id)
+    
+    if not job.output_file_id:
+        logger.warning(f"Batch job {job.id} ended with status {job.status} and no output")
+        state_file.unlink(missing_ok=True)
+        return 0
+    
+    output = await client.files.content(job.output_file_id)
+    cached = 0
+    for line in output.text.splitlines():
+        record = json_loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        content = response["body"]["choices"][0]["message"]["content"]
+        try:
+            json_loads(content)
+        except ValueError:
+            continue
+        cache.set(record["custom_id"], content)
+        cached += 1
+    state_file.unlink(missing_ok=True)
+    
+    logger.info(f"Batch job {job.id} {job.status}: cached {cached}/{len(requests)} {name} responses")
+    return cached
+
+
+async def prefetch_with_batch_api(posts: List[Post], client, limiter: AsyncRateLimiter):
+    """
+    Batch mode: answer the claim extraction and persuasion prompts of a run
+    with Batch API jobs and store the responses in the LLM cache, so the
+    regular pass is served from it. Persuasion prompts depend on the extracted
+    claims, so the stages are submitted one after the other.
+    """
+    if client is None or get_cache("llm") is None:
+        logger.warning("Batch mode needs the LLM client and the response cache, using synchronous calls")
+        return
+    
+    batches = [
+        _dedupe_posts(posts[i:i + Config.BATCH_SIZE])[0]
+        for i in range(0, len(posts), Config.BATCH_SIZE)
+    ]
+    
+    async def collect_and_submit(name: str, stage_calls) -> None:
+        requests: Dict[str, Dict] = {}
+        token = _batch_requests.set(requests)
+        try:
+            await asyncio.gather(*stage_calls, return_exceptions=True)
+        finally:
+            _batch_requests.reset(token)
+        if requests:
+            await run_batch_job(client, requests, name)
+    
+    try:
+        await collect_and_submit("claims", [
+            _extract_claims_rows(unique_posts, client, limiter) for unique_posts in batches
+        ])
+        # Served from the cache now; requests the batch did not answer are made synchronously
+        batch_claims = await asyncio.gather(
+            *(_extract_claims_rows(unique_posts, client, limiter) for unique_posts in batches)
+        )
+        await collect_and_submit("persuasion", [
+            _detect_persuasion_rows(_claim_refs(claims), unique_posts, client, limiter)
+            for unique_posts, claims in zip(batches, batch_claims)
+        ])
+    except Exception as e:
+        logger.warning(f"Batch API run failed ({e}), remaining requests use synchronous calls")
+
+
+async def run_pipeline(use_falcon: bool = True, max_posts: int = None, batch_mode: bool = False,
+                       resume: bool = False):
+    """
+    Async pipeline orchestration. Posts and claims are marshaled
+    Config.LLM_ROWS_PER_CALL at a time into single LLM prompts, and the prompts
+    of a batch are issued concurrently, bounded by Config.MAX_CONCURRENCY and
+    Config.REQUESTS_PER_MINUTE. With batch_mode the LLM prompts are first
+    answered through the provider's Batch API (see prefetch_with_batch_api).
+    
+    After every batch a checkpoint (posts done, N-Triples file size, stats) is
+    written next to the output; with resume a crashed run continues after the
+    last completed batch instead of starting over.
+    """
     logger.info("Starting Persuasion-Aware MUSE Pipeline")
     
     # Initialize tools
     client = get_llm_client()
     nlp = get_nlp()
+    limiter = AsyncRateLimiter(Config.MAX_CONCURRENCY, Config.REQUESTS_PER_MINUTE)
     
     # Load input posts
     if Path(Config.INPUT_FILE).exists():
@@ -638,14 +1731,18 @@ def main_pipeline(use_falcon: bool = True, max_posts: int = None):
         logger.error("No input data found. Run notebook 03_data_preprocessing.ipynb first.")
         return None
     
-    # Initialize master graph and import ontology
-    master_graph = Graph()
-    
-    # Load ontology to include property declarations (so Protégé recognizes data properties)
-    ontology_path = Path(Config.ONTOLOGY_FILE)
-    if ontology_path.exists():
-        master_graph.parse(str(ontology_path), format="turtle")
-        logger.info(f"Loaded ontology from: {ontology_path}")
+    # Annotation triples are streamed to an N-Triples file as posts are processed
+    output_dir = Path(Config.OUTPUT_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    nt_file = output_dir / "annotated_posts.nt"
+    checkpoint_file = output_dir / "annotated_posts.checkpoint.json"
+    # A checkpoint only applies to a run over the same posts, batching and model
+    run_key = {
+        "input_file": Config.INPUT_FILE,
+        "total_posts": len(posts),
+        "batch_size": Config.BATCH_SIZE,
+        "model": Config.LLM_MODEL,
+    }
     
     # Statistics
     stats = {
@@ -653,65 +1750,150 @@ def main_pipeline(use_falcon: bool = True, max_posts: int = None):
         "total_claims": 0,
         "total_techniques": 0,
         "total_entities": 0,
+        "prefiltered_claims": 0,
+        "duplicate_posts": 0,
         "technique_counts": {}
     }
     
+    start = 0
+    if resume and checkpoint_file.exists() and nt_file.exists():
+        checkpoint = json_loads(checkpoint_file.read_bytes())
+        if checkpoint.get("run") == run_key:
+            start = checkpoint["posts_done"]
+            stats = checkpoint["stats"]
+            # Drop triples of a batch that was being written when the run stopped
+            with open(nt_file, 'r+b') as f:
+                f.truncate(checkpoint["nt_bytes"])
+            logger.info(f"Resuming from checkpoint after {start} posts")
+        else:
+            logger.warning("Checkpoint does not match this run, starting over")
+    
+    if batch_mode:
+        await prefetch_with_batch_api(posts[start:], client, limiter)
+    
     # Process posts in batches
-    for i in range(0, len(posts), Config.BATCH_SIZE):
-        batch = posts[i:i + Config.BATCH_SIZE]
-        logger.info(f"Processing batch {i // Config.BATCH_SIZE + 1}")
-        
-        for post in batch:
-            logger.info(f"Processing post: {post.post_id}")
+    emitted_shared = set()  # Entity/agent lines already written to nt_file
+    # Posts append a few dozen short lines each; a large buffer keeps write syscalls rare
+    with open(nt_file, 'a' if start else 'w', encoding='utf-8', buffering=NT_WRITE_BUFFER) as sink, \
+            _make_cpu_pool() as cpu_pool:
+        for i in range(start, len(posts), Config.BATCH_SIZE):
+            batch = posts[i:i + Config.BATCH_SIZE]
+            logger.info(f"Processing batch {i // Config.BATCH_SIZE + 1}")
+            
+            # Duplicate posts (retweets, quotes) are annotated once and the results copied
+            unique_posts, post_pos = _dedupe_posts(batch)
+            stats["duplicate_posts"] += len(batch) - len(unique_posts)
             
             # Stage 1: Extract claims
-            claims = extract_claims(post, client)
-            stats["total_claims"] += len(claims)
-            logger.info(f"  Extracted {len(claims)} claims")
+            batch_claims = await _extract_claims_rows(unique_posts, client, limiter)
+            claim_refs = _claim_refs(batch_claims)
             
+            # Stages 2 and 3 only depend on the claims, so they overlap: persuasion
+            # detection waits on the LLM while NER and Wikidata linking run in a worker thread,
+            # and post sentiment is scored in another (on the CPU pool if configured)
             # Stage 2: Detect persuasion techniques
-            all_techniques = []
-            for claim in claims:
-                techniques = detect_persuasion(claim, post, client)
-                all_techniques.extend(techniques)
-                for t in techniques:
-                    stats["technique_counts"][t.technique_type] = \
-                        stats["technique_counts"].get(t.technique_type, 0) + 1
-            stats["total_techniques"] += len(all_techniques)
-            logger.info(f"  Detected {len(all_techniques)} persuasion techniques")
+            persuasion_task = _detect_persuasion_rows(claim_refs, unique_posts, client, limiter)
+            # Stage 3: Extract entities for all claims with nlp.pipe, then link the whole batch to Wikidata at once
+            entity_task = asyncio.get_running_loop().run_in_executor(
+                None, extract_and_link_entities_batch, [claim for _, claim in claim_refs], nlp
+            )
+            sentiment_task = asyncio.get_running_loop().run_in_executor(
+                None, analyze_sentiment_batch, [post.text for post in unique_posts], nlp, cpu_pool
+            )
+            claim_techniques, claim_entities, batch_sentiments = await asyncio.gather(
+                persuasion_task, entity_task, sentiment_task
+            )
             
-            # Stage 3: Extract and link entities
-            all_entities = []
-            for claim in claims:
-                entities = extract_and_link_entities(claim, post, nlp)
-                all_entities.extend(entities)
-            stats["total_entities"] += len(all_entities)
-            logger.info(f"  Linked {len(all_entities)} entities")
+            batch_techniques = defaultdict(list)
+            for (post_idx, _), techniques in zip(claim_refs, claim_techniques):
+                batch_techniques[post_idx].extend(techniques)
             
-            # Stage 4: Verify claims
-            verifications = [verify_claim(claim) for claim in claims]
-            logger.info(f"  Verified {len(verifications)} claims")
+            batch_entities = defaultdict(list)
+            for (post_idx, _), entities in zip(claim_refs, claim_entities):
+                batch_entities[post_idx].extend(entities)
             
-            # Stage 5: Generate RDF triples
-            post_graph = generate_rdf_triples(
-                post, claims, all_techniques, all_entities, verifications, nlp
-            )
+            for post_idx, post in enumerate(batch):
+                logger.info(f"Processing post: {post.post_id}")
+                
+                pos = post_pos[post_idx]
+                claims = batch_claims[pos]
+                all_techniques = batch_techniques[pos]
+                all_entities = batch_entities[pos]
+                if unique_posts[pos] is not post:
+                    claims, all_techniques, all_entities = _copy_post_annotations(
+                        unique_posts[pos], post, claims, all_techniques, all_entities
+                    )
+                
+                stats["total_claims"] += len(claims)
+                if not passes_persuasion_prefilter(post):
+                    stats["prefiltered_claims"] += len(claims)
+                logger.info(f"  Extracted {len(claims)} claims")
+                
+                for t in all_techniques:
+                    stats["technique_counts"][t.technique_type] = \
+                        stats["technique_counts"].get(t.technique_type, 0) + 1
+                stats["total_techniques"] += len(all_techniques)
+                logger.info(f"  Detected {len(all_techniques)} persuasion techniques")
+                
+                stats["total_entities"] += len(all_entities)
+                logger.info(f"  Linked {len(all_entities)} entities")
+                
+                # Stage 4: Verify claims
+                verifications = [verify_claim(claim) for claim in claims]
+                logger.info(f"  Verified {len(verifications)} claims")
+                
+                # Stage 5: Generate RDF triples and stream them to the output file
+                triple_count = write_ntriples(
+                    generate_rdf_triples(
+                        post, claims, all_techniques, all_entities, verifications, nlp,
+                        emitted=emitted_shared, sentiment=batch_sentiments[pos]
+                    ),
+                    sink
+                )
+                logger.info(f"  Generated {triple_count} RDF triples")
             
-            # Merge into master graph
-            master_graph += post_graph
-            logger.info(f"  Generated {len(post_graph)} RDF triples")
+            sink.flush()
+            json_dump_file({
+                "run": run_key,
+                "posts_done": i + len(batch),
+                "nt_bytes": os.fstat(sink.fileno()).st_size,
+                "stats": stats
+            }, checkpoint_file)
+    
+    checkpoint_file.unlink(missing_ok=True)
+    
+    # Build the output graph once: ontology + streamed annotation triples
+    master_graph = Graph()
+    graph_sources = []
+    
+    # Load ontology to include property declarations (so Protégé recognizes data properties)
+    ontology_path = Path(Config.ONTOLOGY_FILE)
+    if ontology_path.exists():
+        master_graph.parse(str(ontology_path), format="turtle")
+        graph_sources.append(ontology_path)
+        logger.info(f"Loaded ontology from: {ontology_path}")
+    master_graph.parse(str(nt_file), format="nt")
+    graph_sources.append(nt_file)
     
     # Serialize output
-    output_file_turtle = serialize_rdf(master_graph, "turtle")
+    output_file_turtle = serialize_rdf(master_graph, "turtle", sources=graph_sources)
     output_file_json = serialize_rdf(master_graph, "json-ld")
     
     # Save statistics
     stats_file = Path(Config.OUTPUT_DIR) / "pipeline_stats.json"
-    with open(stats_file, 'w') as f:
-        json.dump(stats, f, indent=2)
+    json_dump_file(stats, stats_file)
     logger.info(f"Saved statistics to: {stats_file}")
     
+    if stats["duplicate_posts"]:
+        logger.info(f"Reused annotations for {stats['duplicate_posts']} duplicate posts")
+    if Config.PERSUASION_PREFILTER and stats["total_claims"]:
+        logger.info(
+            f"Persuasion pre-filter skipped {stats['prefiltered_claims']}/{stats['total_claims']} claims "
+            f"({stats['prefiltered_claims'] / stats['total_claims']:.0%})"
+        )
+    
     log_success("Pipeline complete!")
+    logger.info(f"  N-Triples output: {nt_file}")
     logger.info(f"  Turtle output: {output_file_turtle}")
     logger.info(f"  JSON-LD output: {output_file_json}")
     logger.info(f"  Total triples: {len(master_graph)}")
@@ -725,8 +1907,18 @@ def main_pipeline(use_falcon: bool = True, max_posts: int = None):
 # ========================================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Persuasion-Aware MUSE Pipeline")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached LLM and Wikidata responses")
+    parser.add_argument("--batch-mode", action="store_true",
+                        help="Answer LLM prompts through the Batch API (cheaper, completes within 24h)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run from its last checkpoint")
+    args = parser.parse_args()
+    Config.USE_CACHE = not args.no_cache
+    
     try:
-        graph, stats = main_pipeline(use_falcon=True)
+        graph, stats = main_pipeline(use_falcon=True, batch_mode=args.batch_mode, resume=args.resume)
         log_success("Pipeline completed successfully")
         
         # Print summary
@@ -1,11 +1,19 @@
 import csv
+import hashlib
+import os
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
-import statistics
+from typing import Dict, List, Sequence, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")  # Figures are only saved to files
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import tiktoken
 
 
@@ -101,37 +109,66 @@ MUSE_DESCRIPTIONS: Dict[str, str] = {
 }
 
 
+CSV_READ_BUFFER = 8 * 1024 * 1024  # Bytes per read() when scanning CSV files
+
+
 def count_rows_and_header(csv_path: Path) -> Tuple[int, List[str]]:
-    with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if header is None:
+    # Rows are counted on the raw bytes without tokenizing fields: a line
+    # break ends a row unless it falls inside a quoted field, i.e. after an
+    # odd number of quote characters (escaped "" quotes keep the parity)
+    with csv_path.open("rb", buffering=CSV_READ_BUFFER) as f:
+        header_line = f.readline()
+        if not header_line:
             return 0, []
-        row_count = sum(1 for _ in reader)
+        header = next(csv.reader([header_line.decode("utf-8")]))
+        row_count = 0
+        in_quotes = 0
+        for line in f:
+            in_quotes ^= line.count(b'"') & 1
+            if not in_quotes:
+                row_count += 1
+        if in_quotes:  # unterminated quoted field at EOF still forms a row
+            row_count += 1
     return row_count, header
 
 
+def read_csv_columns(csv_path: Path, columns: List[str]) -> pd.DataFrame:
+    # Only the inspected columns are parsed (by pandas' C parser) and kept in
+    # memory; cells stay strings, with empty cells as "" rather than NaN
+    wanted = set(columns)
+    return pd.read_csv(
+        csv_path,
+        usecols=lambda col: col in wanted,
+        dtype=str,
+        keep_default_na=False,
+        memory_map=True,
+    ).fillna("")
+
+
+def non_empty(values: pd.Series, strip: bool = False) -> pd.Series:
+    if strip:
+        values = values.str.strip()
+    return values[values != ""]
+
+
 def get_project_root() -> Path:
     script_path = Path(__file__).resolve()
     return script_path.parent.parent
 
 
-def get_falcon_stats(project_root: Path) -> Tuple[int, List[str], List[Path]]:
+def get_falcon_stats(project_root: Path) -> Tuple[int, List[Path], List[pd.DataFrame]]:
+    # Each split is parsed once, into the columns the EDA uses; the row count
+    # and the EDA are both derived from these frames
     base = project_root / "data" / "input" / "unprocessed" / "falcon_dataset"
     split_files = ["df_train.csv", "df_val.csv", "df_test.csv"]
-    total_rows = 0
-    header: List[str] = []
-    csv_paths: List[Path] = []
-
-    for name in split_files:
-        path = base / name
-        csv_paths.append(path)
-        rows, cols = count_rows_and_header(path)
-        total_rows += rows
-        if not header:
-            header = cols
+    csv_paths = [base / name for name in split_files]
+    frames = [
+        read_csv_columns(path, ["main_tweet"] + FALCON_FALLACY_COLUMNS)
+        for path in csv_paths
+    ]
+    total_rows = sum(len(df) for df in frames)
 
-    return total_rows, header, csv_paths
+    return total_rows, csv_paths, frames
 
 
 def get_single_csv_stats(csv_path: Path) -> Tuple[int, List[str]]:
@@ -148,51 +185,119 @@ def render_column_table(columns: List[str], descriptions: Dict[str, str]) -> str
     return "\n".join(lines)
 
 
-def summarize_numeric(values: List[float]) -> Dict[str, float]:
-    if not values:
+def summarize_numeric(values: Sequence[float]) -> Dict[str, float]:
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
         return {"count": 0, "min": 0.0, "max": 0.0, "mean": 0.0, "median": 0.0}
     return {
-        "count": float(len(values)),
-        "min": float(min(values)),
-        "max": float(max(values)),
-        "mean": float(statistics.mean(values)),
-        "median": float(statistics.median(values)),
+        "count": float(arr.size),
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        "mean": float(arr.mean()),
+        "median": float(np.median(arr)),
     }
 
 
-def render_numeric_summary_table(title: str, values: List[float]) -> List[str]:
+def render_numeric_summary_table(title: str, values: Sequence[float]) -> List[str]:
     stats = summarize_numeric(values)
-    lines: List[str] = []
-    lines.append(f"**{title}**")
-    lines.append("")
-    lines.append("| Metric | Value |")
-    lines.append("| --- | --- |")
-    lines.append(f"| Count | {int(stats['count'])} |")
-    lines.append(f"| Min | {stats['min']:.2f} |")
-    lines.append(f"| Max | {stats['max']:.2f} |")
-    lines.append(f"| Mean | {stats['mean']:.2f} |")
-    lines.append(f"| Median | {stats['median']:.2f} |")
-    lines.append("")
-    return lines
+    table = (
+        f"**{title}**\n"
+        "\n"
+        "| Metric | Value |\n"
+        "| --- | --- |\n"
+        f"| Count | {int(stats['count'])} |\n"
+        f"| Min | {stats['min']:.2f} |\n"
+        f"| Max | {stats['max']:.2f} |\n"
+        f"| Mean | {stats['mean']:.2f} |\n"
+        f"| Median | {stats['median']:.2f} |"
+    )
+    return [table, ""]
+
+
+# Threads for tiktoken's batch encoder (the BPE merges run in Rust without the GIL)
+TOKENIZER_THREADS = min(8, os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=8)
+def get_encoding(name: str = "cl100k_base") -> tiktoken.Encoding:
+    # Loading an encoding parses its BPE ranks; keep one instance per name
+    return tiktoken.get_encoding(name)
 
 
-ENCODING = tiktoken.get_encoding("cl100k_base")
+def count_tokens_batch(texts: List[str]) -> List[float]:
+    # One call into tiktoken's Rust core, which encodes the texts on a thread
+    # pool; tweets carry no special tokens, so the ordinary encoder is used
+    encoded = get_encoding().encode_ordinary_batch(texts, num_threads=TOKENIZER_THREADS)
+    return [float(len(tokens)) for tokens in encoded]
 
 
-def count_tokens(text: str) -> int:
-    if not text:
-        return 0
-    return len(ENCODING.encode(text))
+def cached_token_counts(
+    project_root: Path, sources: List[Path], column: str, texts: pd.Series
+) -> np.ndarray:
+    # Token counts only change with the input files, so they are stored under
+    # data/cache/eda keyed by the files' mtime and size, the column and the
+    # encoding, and re-tokenized only when a source file changes
+    encoding_name = get_encoding().name
+    stamp = "|".join(
+        f"{path.name}:{path.stat().st_mtime_ns}:{path.stat().st_size}" for path in sources
+    )
+    key = hashlib.blake2b(
+        f"{stamp}|{column}|{encoding_name}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+    cache_dir = project_root / "data" / "cache" / "eda"
+    prefix = f"{sources[0].stem}_{column}_tokens_"
+    cache_path = cache_dir / f"{prefix}{key}.npy"
+
+    if cache_path.exists():
+        return np.load(cache_path)
+
+    counts = np.asarray(count_tokens_batch(texts.tolist()), dtype=np.float64)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{prefix}*.npy"):
+        stale.unlink()
+    np.save(cache_path, counts)
+    return counts
 
 
 def render_counter_table(counter: Counter, value_label: str = "Count") -> List[str]:
-    lines: List[str] = []
-    lines.append("| Value | " + value_label + " |")
-    lines.append("| --- | --- |")
-    for key, val in counter.most_common():
-        lines.append(f"| `{key}` | {val} |")
-    lines.append("")
-    return lines
+    head = f"| Value | {value_label} |\n| --- | --- |"
+    body = "".join(f"\n| `{key}` | {val} |" for key, val in counter.most_common())
+    return [head + body, ""]
+
+
+def save_hist(
+    ax: plt.Axes,
+    values: Sequence[float],
+    bins,
+    xlabel: str,
+    ylabel: str,
+    title: str,
+    fig_path: Path,
+) -> None:
+    # All figures are drawn on one reused Axes, cleared before each plot.
+    # Bins are counted by NumPy directly on the array and drawn as bars
+    counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+    ax.clear()
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge")
+    ax.set(xlabel=xlabel, ylabel=ylabel, title=title)
+    ax.figure.tight_layout()
+    ax.figure.savefig(fig_path)
+
+
+def save_bar(
+    ax: plt.Axes,
+    labels: List[str],
+    values: List[int],
+    ylabel: str,
+    title: str,
+    fig_path: Path,
+) -> None:
+    ax.clear()
+    ax.bar(labels, values)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+    ax.set(ylabel=ylabel, title=title)
+    ax.figure.tight_layout()
+    ax.figure.savefig(fig_path)
 
 
 def ensure_eda_dirs(project_root: Path) -> Tuple[Path, Path]:
@@ -204,47 +309,33 @@ def ensure_eda_dirs(project_root: Path) -> Tuple[Path, Path]:
 
 
 def add_falcon_eda(
-    lines: List[str], project_root: Path, falcon_paths: List[Path], fig_dir: Path
+    lines: List[str],
+    project_root: Path,
+    falcon_paths: List[Path],
+    falcon_frames: List[pd.DataFrame],
+    fig_dir: Path,
+    ax: plt.Axes,
 ) -> None:
-    header: List[str] = []
-    rows: List[List[str]] = []
-
-    for path in falcon_paths:
-        with path.open(newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            file_header = next(reader, None)
-            if file_header is None:
-                continue
-            if not header:
-                header = file_header
-            for row in reader:
-                rows.append(row)
-
-    if not header or not rows:
+    df = pd.concat(falcon_frames, ignore_index=True).fillna("")
+
+    if df.empty:
         return
 
-    main_idx = header.index("main_tweet")
-    main_texts = [r[main_idx] for r in rows]
-    main_len_chars = [len(t) for t in main_texts if t]
-    main_len_tokens = [float(count_tokens(t)) for t in main_texts if t]
+    main_texts = non_empty(df["main_tweet"])
+    main_len_chars = main_texts.str.len().to_numpy()
+    main_len_tokens = cached_token_counts(project_root, falcon_paths, "main_tweet", main_texts)
 
-    fallacy_indices = {
-        col: header.index(col)
-        for col in FALCON_FALLACY_COLUMNS
-        if col in header
-    }
-    fallacy_counts: Counter = Counter()
-    fallacies_per_tweet: List[int] = []
-
-    for r in rows:
-        count = 0
-        for col, idx in fallacy_indices.items():
-            if idx < len(r):
-                val = r[idx].strip()
-                if val and val not in {"0", "False", "false", "0.0"}:
-                    fallacy_counts[col] += 1
-                    count += 1
-        fallacies_per_tweet.append(count)
+    # Binary label columns as one numeric matrix (empty/invalid cells count as 0)
+    fallacy_columns = [col for col in FALCON_FALLACY_COLUMNS if col in df.columns]
+    fallacy_mask = (
+        df[fallacy_columns].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy() != 0
+    )
+    fallacy_counts: Counter = Counter({
+        col: count
+        for col, count in zip(fallacy_columns, fallacy_mask.sum(axis=0).tolist())
+        if count
+    })
+    fallacies_per_tweet = fallacy_mask.sum(axis=1)
 
     lines.append("")
     lines.append("### Exploratory analysis")
@@ -262,36 +353,38 @@ def add_falcon_eda(
     # Number of fallacies per tweet
     lines.extend(
         render_numeric_summary_table(
-            "Number of fallacy labels per tweet", [float(x) for x in fallacies_per_tweet]
+            "Number of fallacy labels per tweet", fallacies_per_tweet
         )
     )
 
     # Histogram: main_tweet length (characters)
-    if main_len_chars:
+    if main_len_chars.size:
         fig_path = fig_dir / "falcon_main_tweet_len_chars_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(main_len_chars, bins=40)
-        plt.xlabel("Characters")
-        plt.ylabel("Number of tweets")
-        plt.title("FALCON main_tweet length (characters)")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            main_len_chars,
+            40,
+            "Characters",
+            "Number of tweets",
+            "FALCON main_tweet length (characters)",
+            fig_path,
+        )
         lines.append(
             f"- `main_tweet` length (chars) histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
     # Histogram: main_tweet length (tokens)
-    if main_len_tokens:
+    if main_len_tokens.size:
         fig_path = fig_dir / "falcon_main_tweet_len_tokens_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(main_len_tokens, bins=40)
-        plt.xlabel("Tokens")
-        plt.ylabel("Number of tweets")
-        plt.title("FALCON main_tweet length (tokens)")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            main_len_tokens,
+            40,
+            "Tokens",
+            "Number of tweets",
+            "FALCON main_tweet length (tokens)",
+            fig_path,
+        )
         lines.append(
             f"- `main_tweet` length (tokens) histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
@@ -301,80 +394,55 @@ def add_falcon_eda(
         labels = [k for k, _ in fallacy_counts.most_common()]
         values = [fallacy_counts[k] for k in labels]
         fig_path = fig_dir / "falcon_fallacy_label_counts.png"
-        plt.figure(figsize=(8, 5))
-        plt.bar(labels, values)
-        plt.xticks(rotation=45, ha="right")
-        plt.ylabel("Number of tweets")
-        plt.title("FALCON fallacy label counts")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_bar(
+            ax,
+            labels,
+            values,
+            "Number of tweets",
+            "FALCON fallacy label counts",
+            fig_path,
+        )
         lines.append(
             f"- Fallacy label counts bar chart: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
     # Histogram: number of fallacies per tweet
-    if fallacies_per_tweet:
+    if fallacies_per_tweet.size:
         fig_path = fig_dir / "falcon_fallacies_per_tweet_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(fallacies_per_tweet, bins=range(0, max(fallacies_per_tweet) + 2))
-        plt.xlabel("Number of fallacy labels")
-        plt.ylabel("Number of tweets")
-        plt.title("FALCON number of fallacies per tweet")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            fallacies_per_tweet,
+            range(0, int(fallacies_per_tweet.max()) + 2),
+            "Number of fallacy labels",
+            "Number of tweets",
+            "FALCON number of fallacies per tweet",
+            fig_path,
+        )
         lines.append(
             f"- Number of fallacies per tweet histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
 
-def add_jmbx_eda(lines: List[str], project_root: Path, jmbx_path: Path, fig_dir: Path) -> None:
+def add_jmbx_eda(
+    lines: List[str], project_root: Path, jmbx_path: Path, fig_dir: Path, ax: plt.Axes
+) -> None:
     if not jmbx_path.exists():
         return
 
-    with jmbx_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if header is None:
-            return
-
-        try:
-            bias_idx = header.index("bias")
-            slc_idx = header.index("slc_label")
-            likes_idx = header.index("Number of Likes(favor)")
-            rt_idx = header.index("Retweet Count")
-        except ValueError:
-            return
-
-        biases: List[str] = []
-        slc_labels: List[str] = []
-        likes: List[float] = []
-        rts: List[float] = []
-
-        for row in reader:
-            if bias_idx < len(row):
-                val = row[bias_idx].strip()
-                if val:
-                    biases.append(val)
-            if slc_idx < len(row):
-                val = row[slc_idx].strip()
-                if val:
-                    slc_labels.append(val)
-            if likes_idx < len(row):
-                val = row[likes_idx].strip()
-                if val:
-                    try:
-                        likes.append(float(val))
-                    except ValueError:
-                        pass
-            if rt_idx < len(row):
-                val = row[rt_idx].strip()
-                if val:
-                    try:
-                        rts.append(float(val))
-                    except ValueError:
-                        pass
+    columns = ["bias", "slc_label", "Number of Likes(favor)", "Retweet Count"]
+    df = read_csv_columns(jmbx_path, columns)
+    if any(col not in df.columns for col in columns):
+        return
+
+    biases = non_empty(df["bias"], strip=True)
+    slc_labels = non_empty(df["slc_label"], strip=True)
+    # Unparseable counts become NaN and are dropped, in one vectorized pass per column
+    likes = (
+        pd.to_numeric(df["Number of Likes(favor)"].str.strip(), errors="coerce")
+        .dropna()
+        .to_numpy()
+    )
+    rts = pd.to_numeric(df["Retweet Count"].str.strip(), errors="coerce").dropna().to_numpy()
 
     bias_counts = Counter(biases)
     slc_counts = Counter(slc_labels)
@@ -393,23 +461,23 @@ def add_jmbx_eda(lines: List[str], project_root: Path, jmbx_path: Path, fig_dir:
         lines.append("")
         lines.extend(render_counter_table(slc_counts))
 
-    if likes:
+    if likes.size:
         lines.extend(render_numeric_summary_table("Number of Likes", likes))
-    if rts:
+    if rts.size:
         lines.extend(render_numeric_summary_table("Retweet Count", rts))
 
     if bias_counts:
         labels = [k for k, _ in bias_counts.most_common()]
         values = [bias_counts[k] for k in labels]
         fig_path = fig_dir / "jmbx_bias_counts.png"
-        plt.figure(figsize=(8, 5))
-        plt.bar(labels, values)
-        plt.xticks(rotation=45, ha="right")
-        plt.ylabel("Number of tweets")
-        plt.title("JMBX bias label counts")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_bar(
+            ax,
+            labels,
+            values,
+            "Number of tweets",
+            "JMBX bias label counts",
+            fig_path,
+        )
         lines.append(
             f"- Bias label counts bar chart: `{fig_path.relative_to(project_root).as_posix()}`"
         )
@@ -418,91 +486,69 @@ def add_jmbx_eda(lines: List[str], project_root: Path, jmbx_path: Path, fig_dir:
         labels = [k for k, _ in slc_counts.most_common()]
         values = [slc_counts[k] for k in labels]
         fig_path = fig_dir / "jmbx_slc_label_counts.png"
-        plt.figure(figsize=(8, 5))
-        plt.bar(labels, values)
-        plt.xticks(rotation=45, ha="right")
-        plt.ylabel("Number of tweets")
-        plt.title("JMBX simplified label (`slc_label`) counts")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_bar(
+            ax,
+            labels,
+            values,
+            "Number of tweets",
+            "JMBX simplified label (`slc_label`) counts",
+            fig_path,
+        )
         lines.append(
             f"- Simplified label counts bar chart: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
-    if likes:
+    if likes.size:
         fig_path = fig_dir / "jmbx_likes_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(likes, bins=40)
-        plt.xlabel("Number of likes")
-        plt.ylabel("Number of tweets")
-        plt.title("JMBX likes distribution")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            likes,
+            40,
+            "Number of likes",
+            "Number of tweets",
+            "JMBX likes distribution",
+            fig_path,
+        )
         lines.append(
             f"- Likes histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
-    if rts:
+    if rts.size:
         fig_path = fig_dir / "jmbx_retweets_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(rts, bins=40)
-        plt.xlabel("Number of retweets")
-        plt.ylabel("Number of tweets")
-        plt.title("JMBX retweet count distribution")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            rts,
+            40,
+            "Number of retweets",
+            "Number of tweets",
+            "JMBX retweet count distribution",
+            fig_path,
+        )
         lines.append(
             f"- Retweet count histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
 
-def add_muse_eda(lines: List[str], project_root: Path, muse_path: Path, fig_dir: Path) -> None:
+def add_muse_eda(
+    lines: List[str], project_root: Path, muse_path: Path, fig_dir: Path, ax: plt.Axes
+) -> None:
     if not muse_path.exists():
         return
 
-    with muse_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if header is None:
-            return
-
-        try:
-            post_idx = header.index("post_text")
-            resp_idx = header.index("response_text")
-            resp_type_idx = header.index("response_type")
-            annotated_idx = header.index("annotated")
-        except ValueError:
-            return
-
-        post_len_chars: List[float] = []
-        post_len_tokens: List[float] = []
-        resp_len_chars: List[float] = []
-        resp_len_tokens: List[float] = []
-        resp_types: List[str] = []
-        annotated_vals: List[str] = []
-
-        for row in reader:
-            if post_idx < len(row):
-                t = row[post_idx]
-                if t:
-                    post_len_chars.append(float(len(t)))
-                    post_len_tokens.append(float(count_tokens(t)))
-            if resp_idx < len(row):
-                t = row[resp_idx]
-                if t:
-                    resp_len_chars.append(float(len(t)))
-                    resp_len_tokens.append(float(count_tokens(t)))
-            if resp_type_idx < len(row):
-                val = row[resp_type_idx].strip()
-                if val:
-                    resp_types.append(val)
-            if annotated_idx < len(row):
-                val = row[annotated_idx].strip()
-                if val:
-                    annotated_vals.append(val)
+    columns = ["post_text", "response_text", "response_type", "annotated"]
+    df = read_csv_columns(muse_path, columns)
+    if any(col not in df.columns for col in columns):
+        return
+
+    post_texts = non_empty(df["post_text"])
+    resp_texts = non_empty(df["response_text"])
+    resp_types = non_empty(df["response_type"], strip=True)
+    annotated_vals = non_empty(df["annotated"], strip=True)
+
+    post_len_chars = post_texts.str.len().to_numpy()
+    post_len_tokens = cached_token_counts(project_root, [muse_path], "post_text", post_texts)
+    resp_len_chars = resp_texts.str.len().to_numpy()
+    resp_len_tokens = cached_token_counts(project_root, [muse_path], "response_text", resp_texts)
 
     resp_type_counts = Counter(resp_types)
     annotated_counts = Counter(annotated_vals)
@@ -511,7 +557,7 @@ def add_muse_eda(lines: List[str], project_root: Path, muse_path: Path, fig_dir:
     lines.append("### Exploratory analysis")
     lines.append("")
 
-    if post_len_chars:
+    if post_len_chars.size:
         lines.extend(
             render_numeric_summary_table(
                 "Length of `post_text` in characters", post_len_chars
@@ -521,7 +567,7 @@ def add_muse_eda(lines: List[str], project_root: Path, muse_path: Path, fig_dir:
             render_numeric_summary_table("Length of `post_text` in tokens", post_len_tokens)
         )
 
-    if resp_len_chars:
+    if resp_len_chars.size:
         lines.extend(
             render_numeric_summary_table(
                 "Length of `response_text` in characters", resp_len_chars
@@ -543,30 +589,32 @@ def add_muse_eda(lines: List[str], project_root: Path, muse_path: Path, fig_dir:
         lines.append("")
         lines.extend(render_counter_table(annotated_counts))
 
-    if post_len_chars:
+    if post_len_chars.size:
         fig_path = fig_dir / "muse_post_text_len_chars_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(post_len_chars, bins=40)
-        plt.xlabel("Characters")
-        plt.ylabel("Number of posts")
-        plt.title("MUSE post_text length (characters)")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            post_len_chars,
+            40,
+            "Characters",
+            "Number of posts",
+            "MUSE post_text length (characters)",
+            fig_path,
+        )
         lines.append(
             f"- `post_text` length (chars) histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
 
-    if resp_len_chars:
+    if resp_len_chars.size:
         fig_path = fig_dir / "muse_response_text_len_chars_hist.png"
-        plt.figure(figsize=(8, 5))
-        plt.hist(resp_len_chars, bins=40)
-        plt.xlabel("Characters")
-        plt.ylabel("Number of responses")
-        plt.title("MUSE response_text length (characters)")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_hist(
+            ax,
+            resp_len_chars,
+            40,
+            "Characters",
+            "Number of responses",
+            "MUSE response_text length (characters)",
+            fig_path,
+        )
         lines.append(
             f"- `response_text` length (chars) histogram: `{fig_path.relative_to(project_root).as_posix()}`"
         )
@@ -575,14 +623,14 @@ def add_muse_eda(lines: List[str], project_root: Path, muse_path: Path, fig_dir:
         labels = [k for k, _ in resp_type_counts.most_common()]
         values = [resp_type_counts[k] for k in labels]
         fig_path = fig_dir / "muse_response_type_counts.png"
-        plt.figure(figsize=(8, 5))
-        plt.bar(labels, values)
-        plt.xticks(rotation=45, ha="right")
-        plt.ylabel("Number of entries")
-        plt.title("MUSE response_type counts")
-        plt.tight_layout()
-        plt.savefig(fig_path)
-        plt.close()
+        save_bar(
+            ax,
+            labels,
+            values,
+            "Number of entries",
+            "MUSE response_type counts",
+            fig_path,
+        )
         lines.append(
             f"- response_type counts bar chart: `{fig_path.relative_to(project_root).as_posix()}`"
         )
@@ -591,9 +639,10 @@ def add_muse_eda(lines: List[str], project_root: Path, muse_path: Path, fig_dir:
 def generate_markdown_report() -> None:
     project_root = get_project_root()
     eda_root, fig_dir = ensure_eda_dirs(project_root)
+    fig, ax = plt.subplots(figsize=(8, 5))
 
     # FALCON stats
-    falcon_rows, falcon_header, falcon_paths = get_falcon_stats(project_root)
+    falcon_rows, falcon_paths, falcon_frames = get_falcon_stats(project_root)
 
     # JMBX stats
     jmbx_path = project_root / "data" / "input" / "unprocessed" / "jmbx_dataset.csv"
@@ -630,7 +679,7 @@ def generate_markdown_report() -> None:
         lines.append(f"- **`{prefix}*`** – {desc}")
 
     # FALCON EDA
-    add_falcon_eda(lines, project_root, falcon_paths, fig_dir)
+    add_falcon_eda(lines, project_root, falcon_paths, falcon_frames, fig_dir, ax)
 
     # JMBX section
     lines.append("")
@@ -646,7 +695,7 @@ def generate_markdown_report() -> None:
     lines.append(render_column_table(jmbx_header, JMBX_DESCRIPTIONS))
 
     # JMBX EDA
-    add_jmbx_eda(lines, project_root, jmbx_path, fig_dir)
+    add_jmbx_eda(lines, project_root, jmbx_path, fig_dir, ax)
 
     # MUSE section
     lines.append("")
@@ -662,7 +711,8 @@ def generate_markdown_report() -> None:
     lines.append(render_column_table(muse_header, MUSE_DESCRIPTIONS))
 
     # MUSE EDA
-    add_muse_eda(lines, project_root, muse_path, fig_dir)
+    add_muse_eda(lines, project_root, muse_path, fig_dir, ax)
+    plt.close(fig)
 
     out_path = project_root / "reports/dataset_stats.md"
     out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -1,10 +1,13 @@
-import csv
 from pathlib import Path
 from typing import List
 
+import pandas as pd
+
 
 FALCON_SPLITS: List[str] = ["df_train.csv", "df_val.csv", "df_test.csv"]
 
+CHUNK_ROWS = 50_000  # Rows parsed and written per chunk
+
 FALCON_FALLACY_COLUMNS: List[str] = [
     "Ad Hominem",
     "Appeal to Fear",
@@ -28,52 +31,47 @@ def process_falcon() -> None:
 
     output_path = output_dir / "falcon_processed.csv"
 
-    all_rows = []
-    header_written = False
+    output_columns = ["main_tweet"] + FALCON_FALLACY_COLUMNS
+    row_count = 0
 
+    # Headers are checked before the output is opened, so a split missing a
+    # column fails without leaving a half-written file
+    split_paths: List[Path] = []
     for split_name in FALCON_SPLITS:
         split_path = falcon_dir / split_name
         if not split_path.exists():
             continue
-
-        with split_path.open(newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            header = next(reader, None)
-            if header is None:
-                continue
-
-            try:
-                main_idx = header.index("main_tweet")
-            except ValueError:
-                raise RuntimeError(f"Column 'main_tweet' not found in {split_path}")
-
-            fallacy_indices = {}
-            for col in FALCON_FALLACY_COLUMNS:
-                if col in header:
-                    fallacy_indices[col] = header.index(col)
-                else:
-                    raise RuntimeError(f"Column '{col}' not found in {split_path}")
-
-            for row in reader:
-                if len(row) <= main_idx:
-                    continue
-                main_text = row[main_idx]
-
-                new_row = [main_text]
-                for col in FALCON_FALLACY_COLUMNS:
-                    idx = fallacy_indices[col]
-                    value = row[idx] if idx < len(row) else ""
-                    new_row.append(value)
-
-                all_rows.append(new_row)
-
+        try:
+            header = pd.read_csv(split_path, nrows=0).columns
+        except pd.errors.EmptyDataError:
+            continue
+        for col in output_columns:
+            if col not in header:
+                raise RuntimeError(f"Column '{col}' not found in {split_path}")
+        split_paths.append(split_path)
+
+    # Only the output columns are parsed, as strings so values are written
+    # back unchanged, and each chunk is appended to the output file as soon
+    # as it is read, so memory does not grow with the dataset
     with output_path.open("w", newline="", encoding="utf-8") as out_f:
-        writer = csv.writer(out_f)
-        header = ["main_tweet"] + FALCON_FALLACY_COLUMNS
-        writer.writerow(header)
-        writer.writerows(all_rows)
-
-    print(f"Wrote processed FALCON dataset to: {output_path} (rows: {len(all_rows)})")
+        pd.DataFrame(columns=output_columns).to_csv(out_f, index=False, lineterminator="\r\n")
+
+        for split_path in split_paths:
+            chunks = pd.read_csv(
+                split_path,
+                usecols=output_columns,
+                dtype=str,
+                keep_default_na=False,
+                memory_map=True,
+                chunksize=CHUNK_ROWS,
+            )
+            for chunk in chunks:
+                chunk[output_columns].to_csv(
+                    out_f, header=False, index=False, lineterminator="\r\n"
+                )
+                row_count += len(chunk)
+
+    print(f"Wrote processed FALCON dataset to: {output_path} (rows: {row_count})")
 
 
 if __name__ == "__main__":